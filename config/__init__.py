@@ -1,6 +1,7 @@
 """Configuration module."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -11,6 +12,9 @@ class Config:
     DATA_DIR = Path("data")
     IMAGES_DIR = DATA_DIR / "pngs"
     PROMPTS_DIR = Path("config") / "prompts"
+    CHECKPOINT_DIR = DATA_DIR / ".cache"
+    RESPONSE_CACHE_DIR = CHECKPOINT_DIR / "responses"  # None = no response cache
+    RESPONSE_CACHE_TTL = None  # Seconds before a cached response expires; None = never
     
     # Default files
     DEFAULT_INPUT_FILE = DATA_DIR / "Take-home.pptx"
@@ -20,19 +24,53 @@ class Config:
     DEFAULT_MODEL = "gpt-4.1-mini-2025-04-14"
     DEFAULT_TEMPERATURE = 0.4
     DEFAULT_MAX_TOKENS = 4000
+    DEFAULT_MAX_CONCURRENCY = 8
+    SLIDES_PER_REQUEST = 1  # >1 packs several slides into one API call
+    MAX_REQUEST_TEXT_CHARS = 12000  # Text budget of a multi-slide request
+    TEXT_ONLY_SLIDES_PER_REQUEST = 10  # Slides without an image packed per request
+    SKIP_TRIVIAL_SLIDES = True  # Don't send boilerplate-only slides ("Agenda", page numbers)
+    BATCH_POLL_INTERVAL = 30
+    BATCH_MIN_SLIDES = None  # Decks this large use the Batch API; None = only with --batch
+    MAX_REQUESTS_PER_SECOND = 5  # None = no client-side rate limit
+    MAX_TOKENS_PER_MINUTE = None  # Set to the account's TPM limit to throttle on tokens
+    MAX_RETRIES = 3
+    RETRY_MIN_WAIT = 1
+    RETRY_MAX_WAIT = 20
+    HTTP2 = False  # Multiplex concurrent requests over one connection (needs httpx[http2])
+    
+    # Image settings
+    IMAGE_MAX_EDGE = 1024
+    IMAGE_MAX_SHORT_EDGE = 768  # The vision API's own short-edge limit for tiling
+    IMAGE_JPEG_QUALITY = 85
+    IMAGE_DETAIL = "auto"  # "low" = one 512px view at a flat 85 tokens per slide
+    IMAGE_TOKEN_ESTIMATE = 765  # 85 + 170 per 512px tile, 4 tiles for a 4:3 slide
+    
+    # Parsing settings
+    PARSE_MAX_WORKERS = None  # None = one worker per CPU
+    PARSE_MIN_SLIDES_PER_WORKER = 25
+    
+    # Replacement settings
+    MATCH_WHOLE_WORDS = False  # True = never replace originals inside longer words
     
     # Logging
     DEFAULT_LOG_LEVEL = "INFO"
     
     @classmethod
+    @lru_cache(maxsize=1)
     def get_openai_api_key(cls) -> str:
-        """Get OpenAI API key from environment variable."""
+        """Get OpenAI API key from environment variable (read once per process)."""
         return os.getenv("OPENAI_API_KEY", "")
     
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _input_path(cls, input_file: str) -> Path:
+        """Parse an input filename into a Path, memoized per filename."""
+        return Path(input_file)
+    
     @classmethod
     def get_output_filename(cls, input_file: str) -> str:
         """Generate output filename from input filename."""
-        input_path = Path(input_file)
+        input_path = cls._input_path(str(input_file))
         return str(
             input_path.parent /
             f"{input_path.stem}{cls.DEFAULT_OUTPUT_SUFFIX}{input_path.suffix}"
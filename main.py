@@ -8,12 +8,12 @@ Complete sanitization system for PowerPoint presentations.
 
 import sys
 import logging
+import argparse
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.core.sanitizer import PowerPointSanitizer
 from config import Config
 
 
@@ -25,8 +25,25 @@ def setup_logging():
     )
 
 
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Sanitize a PowerPoint presentation.")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Analyze slides with the OpenAI Batch API (cheaper, not interactive)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached responses and checkpoints and re-analyze every slide",
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main sanitization workflow."""
+    args = parse_args()
     setup_logging()
     logger = logging.getLogger(__name__)
 
@@ -35,6 +52,7 @@ def main():
     OPENAI_API_KEY = Config.get_openai_api_key()
     IMAGES_DIR = str(Config.IMAGES_DIR)
     PROMPTS_DIR = str(Config.PROMPTS_DIR)
+    CHECKPOINT_DIR = str(Config.CHECKPOINT_DIR)
     MODEL = Config.DEFAULT_MODEL
 
     if not OPENAI_API_KEY:
@@ -43,13 +61,21 @@ def main():
         )
         sys.exit(1)
 
+    # Imported only once there is work to do: python-pptx, lxml, pydantic and the
+    # OpenAI client take a few hundred milliseconds to load, which --help and a
+    # missing API key should not pay for
+    from src.core.sanitizer import PowerPointSanitizer
+
     try:
         # Initialize sanitizer
         sanitizer = PowerPointSanitizer(
             model=MODEL,
             openai_api_key=OPENAI_API_KEY, 
             images_dir=IMAGES_DIR, 
-            prompts_dir=PROMPTS_DIR
+            prompts_dir=PROMPTS_DIR,
+            batch_mode=args.batch,
+            checkpoint_dir=CHECKPOINT_DIR,
+            force_refresh=args.refresh
         )
 
         # Generate output filename
@@ -0,0 +1,196 @@
+"""
+Checkpoint Store
+================
+
+Persists per-slide analysis results so an interrupted sanitization run can
+resume without paying for the OpenAI calls of slides it already analyzed.
+
+Results are appended to `<cache_dir>/<run_id>/detections.jsonl`, where `run_id`
+is derived from a hash of the input file and the analysis settings (model,
+prompts), so edits to the deck or a change of model start a fresh run. A run's
+checkpoints are deleted once its sanitized file has been saved.
+Slides are buffered in memory and written in batches, one JSON line per batch,
+so a crash loses at most the unflushed batch and never corrupts earlier lines.
+The ID of a submitted Batch API job is kept in `<run_id>/batch_id` until its
+results are collected, so a run interrupted while waiting picks the job up again
+instead of submitting (and paying for) a new one.
+"""
+
+import hashlib
+import logging
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from pydantic import TypeAdapter
+
+from ..models.detection import DetectionResponse
+from ..utils.hashing import update_with_parts
+
+# Reads and writes whole journal lines as JSON
+_JOURNAL_LINE = TypeAdapter(Dict[str, Dict[int, DetectionResponse]])
+
+
+class CheckpointStore:
+    """
+    Per-slide cache of DetectionResponse results for a single input file.
+    
+    Attributes:
+        run_id: Short hash identifying the input file contents and the
+            analysis settings
+        run_dir: Directory holding this run's checkpoint journal
+        journal_path: JSONL file the slide results are appended to
+        batch_id_path: File holding the ID of a Batch API job still in progress
+        flush_every: Number of buffered slides that triggers a write
+        logger: Logger for tracking checkpoint operations
+    """
+
+    FLUSH_EVERY = 10
+
+    def __init__(
+        self,
+        cache_dir: str,
+        input_file: str,
+        flush_every: int = None,
+        settings: Iterable[Any] = (),
+    ):
+        """
+        Initialize the store for an input file and load any previous results.
+        
+        Args:
+            cache_dir (str): Root directory for checkpoints
+            input_file (str): PowerPoint file being sanitized
+            flush_every (int, optional): Slides buffered per write.
+                Defaults to CheckpointStore.FLUSH_EVERY
+            settings (Iterable[Any], optional): Analysis settings the results
+                depend on (model, prompts, ...); results stored under other
+                settings are not reused
+        """
+        self.logger = logging.getLogger(__name__)
+        self.run_id = self._hash_run(input_file, settings)
+        self.run_dir = Path(cache_dir) / self.run_id
+        self.journal_path = self.run_dir / "detections.jsonl"
+        self.batch_id_path = self.run_dir / "batch_id"
+        self.flush_every = flush_every or self.FLUSH_EVERY
+
+        self._needs_newline = False
+        self._completed: Dict[int, DetectionResponse] = self._read_journal()
+        self._pending: Dict[int, DetectionResponse] = {}
+
+    @staticmethod
+    def _hash_run(file_path: str, settings: Iterable[Any] = ()) -> str:
+        """
+        Compute a short SHA-256 digest of a file's contents and the settings.
+        
+        Args:
+            file_path (str): File to hash
+            settings (Iterable[Any], optional): Analysis settings to include
+            
+        Returns:
+            str: First 12 hex characters of the digest
+        """
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        update_with_parts(digest, settings)
+        return digest.hexdigest()[:12]
+
+    def _read_journal(self) -> Dict[int, DetectionResponse]:
+        """
+        Read all results stored by previous runs.
+        
+        A truncated or unreadable line (e.g. from a crash mid-write) is skipped.
+        
+        Returns:
+            Dict[int, DetectionResponse]: Stored results keyed by slide number
+        """
+        results = {}
+        if not self.journal_path.exists():
+            return results
+
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                # A crash mid-write leaves the last line without its newline
+                self._needs_newline = not line.endswith("\n")
+                try:
+                    results.update(_JOURNAL_LINE.validate_json(line)["slides"])
+                except (ValueError, KeyError) as e:
+                    # ValidationError (a ValueError) for a truncated or corrupt
+                    # line, KeyError for valid JSON without "slides"
+                    self.logger.warning("Ignoring unreadable checkpoint line: %s", e)
+
+        return results
+
+    def load(self, slide_number: int) -> Optional[DetectionResponse]:
+        """
+        Get the stored result for a slide.
+        
+        Args:
+            slide_number (int): Slide to look up
+            
+        Returns:
+            Optional[DetectionResponse]: Stored result, or None if the slide has
+                no checkpoint
+        """
+        return self._completed.get(slide_number)
+
+    def save(self, slide_number: int, detections: DetectionResponse):
+        """
+        Record the result for a slide, writing to disk once enough are buffered.
+        
+        Args:
+            slide_number (int): Slide the result belongs to
+            detections (DetectionResponse): Analysis result to store
+        """
+        self._completed[slide_number] = detections
+        self._pending[slide_number] = detections
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Append all buffered results to the journal as a single line."""
+        if not self._pending:
+            return
+
+        line = _JOURNAL_LINE.dump_json({"slides": self._pending})
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_path, "ab") as f:
+            if self._needs_newline:
+                f.write(b"\n")
+                self._needs_newline = False
+            f.write(line + b"\n")
+        self._pending.clear()
+
+    def load_batch_id(self) -> Optional[str]:
+        """
+        Get the ID of a Batch API job submitted by an earlier, interrupted run.
+        
+        Returns:
+            Optional[str]: Batch ID, or None if no job is outstanding
+        """
+        try:
+            return self.batch_id_path.read_text(encoding="utf-8").strip() or None
+        except FileNotFoundError:
+            return None
+
+    def save_batch_id(self, batch_id: str):
+        """
+        Record a submitted Batch API job until its results are collected.
+        
+        Args:
+            batch_id (str): ID returned when the batch was created
+        """
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        self.batch_id_path.write_text(batch_id, encoding="utf-8")
+
+    def clear_batch_id(self):
+        """Forget the outstanding Batch API job once it has finished."""
+        self.batch_id_path.unlink(missing_ok=True)
+
+    def clear(self):
+        """Delete this run's checkpoints once they are no longer needed."""
+        self._completed.clear()
+        self._pending.clear()
+        self._needs_newline = False
+        shutil.rmtree(self.run_dir, ignore_errors=True)
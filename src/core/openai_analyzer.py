@@ -9,23 +9,310 @@ be sanitized or redacted.
 
 The analyzer supports:
 - Multi-modal analysis (text + images)
+- Concurrent analysis of multiple slides with bounded parallelism (sync or async)
+- Offline bulk analysis through the OpenAI Batch API
+- Content-addressed caching of responses across runs
 - Configurable sensitivity levels
 - Custom prompts for domain-specific detection
 - Structured response parsing with categorized detections
 """
 
+import asyncio
+import io
 import json
 import logging
 import base64
+import functools
+import hashlib
 import os
-from typing import List, Dict, Any
+import random
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
-from openai import OpenAI
+from pydantic import TypeAdapter
 
-from ..models.detection import OpenAIDetection, DetectionResponse
+from ..models.detection import (
+    BatchDetectionResponse,
+    DetectionResponse,
+    OpenAIDetection,
+)
+from ..utils.rate_limiter import TokenBucket
+from .response_cache import ResponseCache
 from config import Config
 
 
+@functools.cache
+def _retryable_errors() -> tuple:
+    """
+    Transient API errors worth retrying; anything else fails the slide immediately.
+    
+    Resolved on first use so importing this module does not pull in the openai SDK.
+    """
+    from openai import (
+        APIConnectionError,
+        APITimeoutError,
+        InternalServerError,
+        RateLimitError,
+    )
+
+    # RateLimitError is HTTP 429, InternalServerError any 5xx status
+    return (RateLimitError, InternalServerError, APITimeoutError, APIConnectionError)
+
+
+@functools.cache
+def _rate_limit_error() -> type:
+    """openai.RateLimitError, resolved on first use like _retryable_errors."""
+    from openai import RateLimitError
+
+    return RateLimitError
+
+
+# Dumps a list of detections to dicts in one call instead of one per model
+_DETECTION_LIST = TypeAdapter(List[OpenAIDetection])
+
+# Appended to the user prompt of slides analyzed without their image
+_NO_IMAGE_NOTE = "No slide image is available; analyze the extracted text only."
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """
+    Read the server's requested wait from an API error's response headers.
+    
+    Args:
+        error (Exception): Error raised by the OpenAI client
+        
+    Returns:
+        Optional[float]: Seconds from retry-after-ms or retry-after (capped at a
+            minute), or None if the error carries no usable value
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            seconds = float(headers["retry-after-ms"]) / 1000
+        elif headers.get("retry-after"):
+            seconds = float(headers["retry-after"])
+        else:
+            return None
+    except ValueError:
+        # An HTTP-date Retry-After; the backoff delay is used instead
+        return None
+    return min(max(seconds, 0.0), 60.0)
+
+
+def _image_tokens() -> int:
+    """Estimated prompt tokens of one slide image at the configured detail level."""
+    # Low detail is billed at a flat 85 tokens, whatever the image size
+    return 85 if Config.IMAGE_DETAIL == "low" else Config.IMAGE_TOKEN_ESTIMATE
+
+
+def _estimate_tokens(messages: List[Dict[str, Any]], max_tokens: int) -> int:
+    """
+    Roughly estimate the tokens a request counts against the per-minute limit.
+    
+    The API reserves the prompt tokens plus max_tokens for the completion. Text
+    is estimated at ~4 characters per token and each image at the cost of a
+    downscaled slide (see _image_tokens), which is close enough to
+    stay under the limit without a tokenizer dependency.
+    
+    Args:
+        messages (List[Dict[str, Any]]): Chat messages of the request
+        max_tokens (int): Completion token limit of the request
+        
+    Returns:
+        int: Estimated token count
+    """
+    chars = 0
+    images = 0
+    for message in messages:
+        content = message["content"]
+        if isinstance(content, str):
+            chars += len(content)
+            continue
+        for part in content:
+            if part["type"] == "text":
+                chars += len(part["text"])
+            else:
+                images += 1
+    return chars // 4 + images * _image_tokens() + max_tokens
+
+
+# Text elements that never carry client information on their own: section
+# titles of boilerplate slides, page numbers and footnote markers
+_TRIVIAL_TEXT_RE = re.compile(
+    r"(?:agenda|contents|table of contents|thank you|thanks|questions|q\s*&\s*a"
+    r"|appendix|back-?up|discussion|next steps|page\s*\d{1,3}|\d{1,3}|[-*•▪])?",
+    re.IGNORECASE,
+)
+
+
+def is_trivial_slide(slide_text) -> bool:
+    """
+    Tell whether a slide's text is boilerplate that needs no analysis.
+    
+    A slide is trivial when every text element is empty or a stock phrase
+    such as "Agenda", "Thank you" or a page number. Short slides are not
+    trivial as such: a two-word title can name the client.
+    
+    Args:
+        slide_text: Text strings extracted from the slide
+        
+    Returns:
+        bool: True if no element could contain sensitive content
+    """
+    return all(
+        _TRIVIAL_TEXT_RE.fullmatch(text.strip().rstrip(".!?:")) for text in slide_text
+    )
+
+
+@functools.cache
+def _read_prompt(prompts_dir: str, filename: str) -> str:
+    """
+    Read a prompt template, shared by all analyzers using the same directory.
+    
+    Args:
+        prompts_dir (str): Directory containing the prompt templates
+        filename (str): Name of the prompt file to read
+        
+    Returns:
+        str: Stripped content of the prompt file
+    """
+    with open(os.path.join(prompts_dir, filename), "r", encoding="utf-8") as f:
+        return f.read().strip()
+
+
+@functools.lru_cache(maxsize=64)
+def _format_user_prompt(template: str, slide_text) -> str:
+    """
+    Fill the user prompt template with a slide's extracted text.
+    
+    Args:
+        template (str): User prompt template with an {extracted_text_list} field
+        slide_text: Tuple of slide text strings, or an already formatted string
+        
+    Returns:
+        str: Formatted user prompt
+    """
+    # A compact JSON array: double-quoted strings with unambiguous escaping and
+    # no Python repr quirks, in fewer tokens than str(list)
+    if isinstance(slide_text, tuple):
+        formatted_text = json.dumps(
+            slide_text, ensure_ascii=False, separators=(",", ":")
+        )
+    else:
+        formatted_text = slide_text
+    return template.format(extracted_text_list=formatted_text)
+
+
+def _image_identity(image_path: Optional[str]):
+    """
+    Identify a slide image by its contents, so identical renders compare equal.
+    
+    Args:
+        image_path (Optional[str]): Path to the slide image, or None
+        
+    Returns:
+        SHA-256 digest of the file, None without an image, or the path itself if
+        the file cannot be read (left for the analysis to report)
+    """
+    if image_path is None:
+        return None
+    try:
+        with open(image_path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").digest()
+    except OSError:
+        return image_path
+
+
+# Downscaled JPEG data URLs are ~50 KB each, so a few hundred slides fit easily
+@functools.lru_cache(maxsize=512)
+def _encode_image_cached(image_path: str, mtime_ns: int, size: int) -> str:
+    """
+    Downscale and JPEG-encode an image, memoized on its path, mtime and size.
+    
+    Vision tokens scale with pixel area, so the slide render is resized to fit
+    within Config.IMAGE_MAX_EDGE (Lanczos resampling) and re-encoded as JPEG
+    before base64 encoding. This shrinks the upload and the per-slide image cost.
+    The short edge is also capped at Config.IMAGE_MAX_SHORT_EDGE: the API scales
+    larger images down to that before tiling them, so extra pixels would only
+    be uploaded to be thrown away. With Config.IMAGE_DETAIL "low", the model
+    only sees a 512px version, so the image is not sent any larger.
+    The complete data URL is cached so every request for the slide shares one
+    string instead of rebuilding it.
+    
+    Args:
+        image_path (str): Path to the image file to encode
+        mtime_ns (int): Modification time of the file in nanoseconds
+        size (int): Size of the file in bytes; with mtime_ns, makes edits
+            invalidate the cache even within the timestamp granularity
+        
+    Returns:
+        str: data:image/jpeg;base64 URL of the image
+    """
+    from PIL import Image
+
+    with Image.open(image_path) as image:
+        image = image.convert("RGB")
+        # reducing_gap=1.5 box-reduces by an integer factor before the Lanczos
+        # pass once the render is at least 3x the target (Pillow's default of 2.0
+        # only does so from 4x, so a 3300px render was resampled at full size)
+        width, height = image.size
+        max_edge = 512 if Config.IMAGE_DETAIL == "low" else Config.IMAGE_MAX_EDGE
+        scale = min(
+            1.0,
+            max_edge / max(width, height),
+            Config.IMAGE_MAX_SHORT_EDGE / min(width, height),
+        )
+        image.thumbnail(
+            (max(1, round(width * scale)), max(1, round(height * scale))),
+            Image.LANCZOS,
+            reducing_gap=1.5,
+        )
+        buffer = io.BytesIO()
+        image.save(
+            buffer, format="JPEG", quality=Config.IMAGE_JPEG_QUALITY, optimize=True
+        )
+    return "data:image/jpeg;base64," + base64.b64encode(buffer.getbuffer()).decode(
+        "ascii"
+    )
+
+
+class _AsyncClientSession:
+    """
+    Async OpenAI client used for the duration of one analysis call.
+    
+    An async client is bound to the event loop it runs on, so each call gets
+    its own and closes it when done; concurrent calls never share one. The
+    client is created on the first request, so a call served entirely from the
+    response cache does not create one.
+    """
+
+    def __init__(self, create_client: Callable[[], Any]):
+        """
+        Initialize the session without creating its client yet.
+        
+        Args:
+            create_client (Callable[[], Any]): Builds the AsyncOpenAI client
+        """
+        self._create_client = create_client
+
+    @functools.cached_property
+    def client(self):
+        """The session's AsyncOpenAI client, created on first use."""
+        return self._create_client()
+
+    async def __aenter__(self) -> "_AsyncClientSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if "client" in self.__dict__:
+            await self.client.close()
+
+
 class OpenAIAnalyzer:
     """
     Analyzes text content for sensitive information using OpenAI with improved prompts.
@@ -39,14 +326,22 @@ class OpenAIAnalyzer:
     results with categorization, sensitivity levels, and suggested replacements.
     
     Attributes:
-        client: OpenAI API client instance
+        api_key: OpenAI API key used to create the clients
+        client: OpenAI API client instance (created lazily)
         logger: Logger for tracking analysis operations
         model: OpenAI model name to use for analysis
         prompts_dir: Directory containing custom prompt templates
         temperature: Sampling temperature for model responses
         max_tokens: Maximum tokens for model responses
-        system_prompt: System prompt template for analysis
-        user_prompt: User prompt template for specific requests
+        max_concurrency: Maximum number of in-flight requests in analyze_slides
+        rate_limiter: Token bucket capping the API request rate (None when disabled)
+        token_limiter: Token bucket capping API tokens per minute (None when disabled)
+        slides_per_request: Number of slides packed into one request by analyze_slides
+        response_cache: Cache of responses across runs (None when disabled)
+        force_refresh: Whether cached responses are ignored
+        system_prompt: System prompt template for analysis (loaded lazily)
+        prompt_cache_key: Routing key shared by requests with the same prompt prefix
+        user_prompt: User prompt template for specific requests (loaded lazily)
     """
 
     def __init__(
@@ -55,13 +350,19 @@ class OpenAIAnalyzer:
         model=None, 
         prompts_dir=None,
         temperature=None,
-        max_tokens=None
+        max_tokens=None,
+        max_concurrency=None,
+        requests_per_second=None,
+        slides_per_request=None,
+        tokens_per_minute=None,
+        cache_dir=None,
+        force_refresh=False
     ):
         """
         Initialize the OpenAI analyzer with API credentials and configuration.
         
-        Sets up the OpenAI client, loads custom prompts if available, and configures
-        model parameters for sensitive content detection.
+        Sets up the OpenAI client and configures model parameters for sensitive
+        content detection. Prompt templates are loaded on first use.
         
         Args:
             api_key (str): OpenAI API key for authentication
@@ -72,6 +373,20 @@ class OpenAIAnalyzer:
                 Defaults to Config.DEFAULT_TEMPERATURE
             max_tokens (int, optional): Maximum response tokens. 
                 Defaults to Config.DEFAULT_MAX_TOKENS
+            max_concurrency (int, optional): Maximum concurrent API requests
+                issued by analyze_slides. Defaults to Config.DEFAULT_MAX_CONCURRENCY
+            requests_per_second (float, optional): Client-side cap on the API
+                request rate, including retries. Defaults to
+                Config.MAX_REQUESTS_PER_SECOND
+            slides_per_request (int, optional): Number of slides analyze_slides
+                packs into one request. Defaults to Config.SLIDES_PER_REQUEST
+            tokens_per_minute (int, optional): Client-side cap on the estimated
+                API tokens per minute. Defaults to Config.MAX_TOKENS_PER_MINUTE
+            cache_dir (str, optional): Directory of the response cache.
+                Defaults to Config.RESPONSE_CACHE_DIR; caching is disabled if
+                both are None
+            force_refresh (bool): Ignore cached responses (fresh responses are
+                still stored). Defaults to False
                 
         Raises:
             ValueError: If API key is not provided
@@ -79,16 +394,136 @@ class OpenAIAnalyzer:
         if not api_key:
             raise ValueError("OpenAI API key is required")
 
-        self.client = OpenAI(api_key=api_key)
+        self.api_key = api_key
         self.logger = logging.getLogger(__name__)
         self.model = model or Config.DEFAULT_MODEL
         self.prompts_dir = prompts_dir or str(Config.PROMPTS_DIR)
         self.temperature = temperature or Config.DEFAULT_TEMPERATURE
         self.max_tokens = max_tokens or Config.DEFAULT_MAX_TOKENS
+        self.max_concurrency = max_concurrency or Config.DEFAULT_MAX_CONCURRENCY
+        self.slides_per_request = slides_per_request or Config.SLIDES_PER_REQUEST
+        rate = requests_per_second or Config.MAX_REQUESTS_PER_SECOND
+        self.rate_limiter = TokenBucket(rate) if rate else None
+        tpm = tokens_per_minute or Config.MAX_TOKENS_PER_MINUTE
+        self.token_limiter = TokenBucket(tpm / 60, capacity=tpm) if tpm else None
+        cache_dir = cache_dir or Config.RESPONSE_CACHE_DIR
+        self.response_cache = (
+            ResponseCache(cache_dir, ttl=Config.RESPONSE_CACHE_TTL) if cache_dir else None
+        )
+        self.force_refresh = force_refresh
+
+    @functools.cached_property
+    def client(self):
+        """OpenAI client, created (and the SDK imported) on first use."""
+        from openai import DefaultHttpxClient, OpenAI
+
+        # Retries are handled by _parse_with_retry, so disable the SDK's own
+        return OpenAI(
+            api_key=self.api_key,
+            max_retries=0,
+            **self._http_client_options(DefaultHttpxClient),
+        )
+
+    def _new_async_client(self):
+        """Create an async OpenAI client; see _AsyncClientSession."""
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+        return AsyncOpenAI(
+            api_key=self.api_key,
+            max_retries=0,
+            **self._http_client_options(DefaultAsyncHttpxClient),
+        )
+
+    def _http_client_options(self, client_class) -> Dict[str, Any]:
+        """
+        Build the http_client argument of an OpenAI client, if one is needed.
+        
+        With Config.HTTP2, concurrent requests are multiplexed as streams over
+        one connection instead of each holding its own. That needs the optional
+        h2 package (`httpx[http2]`); without it the SDK's default HTTP/1.1
+        client, which already pools and keeps connections alive, is used.
+        
+        Args:
+            client_class: The SDK's DefaultHttpxClient or DefaultAsyncHttpxClient
+            
+        Returns:
+            Dict[str, Any]: Keyword arguments for the OpenAI client constructor
+        """
+        if not Config.HTTP2:
+            return {}
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            self.logger.warning("HTTP2 is enabled but h2 is not installed, using HTTP/1.1")
+            return {}
+        return {"http_client": client_class(http2=True)}
+
+    def verify_access(self):
+        """
+        Check the API key and model with one cheap request before any real work.
+        
+        Retrieving the model's metadata fails on an invalid key or an unknown
+        model name, so those problems surface before the deck is parsed rather
+        than on the first analysis call. Network errors only log a warning, so
+        runs served from the response cache still work offline.
+        
+        Raises:
+            ValueError: If the API key is rejected or the model is not available
+        """
+        from openai import AuthenticationError, NotFoundError, PermissionDeniedError
+
+        try:
+            self.client.models.retrieve(self.model)
+        except (AuthenticationError, PermissionDeniedError) as e:
+            raise ValueError(f"OpenAI API key was rejected: {e}") from e
+        except NotFoundError as e:
+            raise ValueError(f"OpenAI model {self.model} is not available: {e}") from e
+        except Exception as e:
+            self.logger.warning("Could not verify OpenAI API access: %s", e)
+
+    @functools.cached_property
+    def system_prompt(self) -> str:
+        """System prompt template, loaded from disk on first access."""
+        return self._load_prompt("system_prompt.txt")
 
-        # Load prompts from files or use improved defaults
-        self.system_prompt = self._load_prompt("system_prompt.txt")
-        self.user_prompt = self._load_prompt("user_prompt.txt")
+    @functools.cached_property
+    def user_prompt(self) -> str:
+        """User prompt template, loaded from disk on first access."""
+        return self._load_prompt("user_prompt.txt")
+
+    @property
+    def analysis_settings(self) -> Tuple[Any, ...]:
+        """
+        Everything besides the slide itself that an analysis result depends on.
+        
+        Used to key stored results (response cache entries, checkpoints), so a
+        change of model, prompt or request parameters is not answered with
+        results from the old settings.
+        """
+        return (
+            self.model,
+            self.temperature,
+            self.max_tokens,
+            Config.IMAGE_DETAIL,
+            self.system_prompt,
+            self.user_prompt,
+        )
+
+    @functools.cached_property
+    def prompt_cache_key(self) -> str:
+        """
+        Key routing requests that share a prompt prefix to the same API cache.
+        
+        Every request starts with the same system prompt and user prompt
+        instructions, with the slide text and image last, so the API can serve
+        that prefix from its prompt cache. Passing one key for all of them keeps
+        the requests on the same cache shard; it changes with the model and
+        prompt templates, just like the prefix itself.
+        """
+        digest = hashlib.sha256(
+            "\0".join((self.model, self.system_prompt, self.user_prompt)).encode("utf-8")
+        )
+        return f"pptxsanitizer-{digest.hexdigest()[:16]}"
 
     def _load_prompt(self, filename: str) -> str:
         """
@@ -101,32 +536,32 @@ class OpenAIAnalyzer:
             str: Content of the prompt file, or empty string if loading fails
         """
         try:
-            prompt_path = os.path.join(self.prompts_dir, filename)
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                return f.read().strip()
+            return _read_prompt(self.prompts_dir, filename)
         except Exception as e:
             self.logger.warning("Could not load prompt %s: %s", filename, e)
             return ""
 
     def _encode_image(self, image_path: str) -> str:
         """
-        Encode image file to base64 string for API transmission.
+        Encode image file to a base64 data URL for API transmission.
         
-        Reads the image file and converts it to a base64-encoded string suitable
-        for sending to OpenAI's vision API endpoints.
+        Downscales the image, re-encodes it as JPEG and converts it to a base64
+        data URL suitable for sending to OpenAI's vision API endpoints. Results are
+        cached per (path, mtime, size), so retries and re-analysis of a slide
+        (e.g. with another model or prompt) reuse the encoding.
         
         Args:
             image_path (str): Path to the image file to encode
             
         Returns:
-            str: Base64-encoded string representation of the image
+            str: data:image/jpeg;base64 URL of the image
             
         Raises:
             Exception: If image file cannot be read or encoded
         """
         try:
-            with open(image_path, "rb") as image_file:
-                return base64.b64encode(image_file.read()).decode("utf-8")
+            stat = os.stat(image_path)
+            return _encode_image_cached(image_path, stat.st_mtime_ns, stat.st_size)
         except Exception as e:
             self.logger.error("Error encoding image %s: %s", image_path, e)
             raise
@@ -136,7 +571,8 @@ class OpenAIAnalyzer:
         Prepare the user prompt with extracted slide text content.
         
         Formats the extracted text content into the user prompt template,
-        ensuring proper string representation for API consumption.
+        ensuring proper string representation for API consumption. The result is
+        memoized, so re-analysis of the same slide text skips the formatting.
         
         Args:
             slide_text (List[str]): List of text strings extracted from the slide
@@ -144,15 +580,306 @@ class OpenAIAnalyzer:
         Returns:
             str: Formatted user prompt with embedded text content
         """
-        # Format the text content as a proper list representation
+        # Tuples are hashable, so identical slide text reuses the cached prompt
         if isinstance(slide_text, list):
-            formatted_text = str(slide_text)
-        else:
-            formatted_text = slide_text
-        return self.user_prompt.format(extracted_text_list=formatted_text)
+            slide_text = tuple(slide_text)
+        return _format_user_prompt(self.user_prompt, slide_text)
+
+    def _slide_content(
+        self, slide_text: List[str], image_path: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the user message parts describing one slide.
+        
+        Args:
+            slide_text (List[str]): List of text strings extracted from the slide
+            image_path (Optional[str]): Path to the slide image file, or None to
+                analyze the text alone
+            
+        Returns:
+            List[Dict[str, Any]]: The prompt text, followed by the image if any
+        """
+        # Prepare the user prompt with extracted text
+        user_prompt = self._prepare_user_prompt(slide_text)
+        if image_path is None:
+            return [{"type": "text", "text": f"{user_prompt}\n{_NO_IMAGE_NOTE}"}]
+
+        return [
+            {"type": "text", "text": user_prompt},
+            {
+                "type": "image_url",
+                "image_url": {
+                    "url": self._encode_image(image_path),
+                    "detail": Config.IMAGE_DETAIL,
+                },
+            },
+        ]
+
+    def _build_messages(
+        self, slide_text: List[str], image_path: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the chat messages for a single slide analysis request.
+        
+        Args:
+            slide_text (List[str]): List of text strings extracted from the slide
+            image_path (Optional[str]): Path to the slide image file for visual
+                analysis, or None for a text-only request
+            
+        Returns:
+            List[Dict[str, Any]]: System and user messages for the API call
+        """
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": self._slide_content(slide_text, image_path)},
+        ]
+
+    def _build_group_messages(
+        self, items: List[Tuple[List[str], str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the chat messages for one request covering several slides.
+        
+        The system prompt is sent once for the whole group; each slide follows as
+        a numbered block with its own prompt text and image.
+        
+        Args:
+            items (List[Tuple[List[str], str]]): (slide_text, image_path) pairs
+            
+        Returns:
+            List[Dict[str, Any]]: System and user messages for the API call
+        """
+        content = [
+            {
+                "type": "text",
+                "text": (
+                    f"The following {len(items)} slides are numbered 1 to {len(items)}. "
+                    "Analyze each slide independently and return one entry per "
+                    "slide, with its slide_number and its detections."
+                ),
+            }
+        ]
+        for number, (slide_text, image_path) in enumerate(items, start=1):
+            parts = self._slide_content(slide_text, image_path)
+            parts[0] = {"type": "text", "text": f"Slide {number}\n{parts[0]['text']}"}
+            content.extend(parts)
+
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": content},
+        ]
+
+    def _cache_lookup(
+        self, slide_text: List[str], image_path: Optional[str], force_refresh: bool = None
+    ) -> Tuple[Optional[str], Optional[DetectionResponse]]:
+        """
+        Compute a slide's cache key and look up its stored response.
+        
+        Args:
+            slide_text (List[str]): List of text strings extracted from the slide
+            image_path (Optional[str]): Path to the slide image file, or None
+            force_refresh (bool, optional): Skip the lookup. Defaults to
+                self.force_refresh
+            
+        Returns:
+            Tuple[Optional[str], Optional[DetectionResponse]]: The key (None when
+                caching is disabled) and the stored response (None on a miss)
+        """
+        if self.response_cache is None:
+            return None, None
+
+        key = ResponseCache.make_key(image_path, slide_text, *self.analysis_settings)
+        if force_refresh is None:
+            force_refresh = self.force_refresh
+        if force_refresh:
+            return key, None
+        return key, self.response_cache.get(key)
+
+    def _log_detection_summary(self, response_content: DetectionResponse):
+        """
+        Log the number of detections per sensitivity level.
+        
+        Args:
+            response_content (DetectionResponse): Parsed analysis response
+        """
+        if not response_content or not response_content.detections:
+            return
+        # Counting risk levels is wasted work when the summary is not shown
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        high_risk = sum(
+            1 for d in response_content.detections if d.sensitivity_level == "HIGH"
+        )
+        medium_risk = sum(
+            1 for d in response_content.detections if d.sensitivity_level == "MEDIUM"
+        )
+        low_risk = sum(
+            1 for d in response_content.detections if d.sensitivity_level == "LOW"
+        )
+
+        self.logger.info(
+            "Found %d detections: %d HIGH risk, %d MEDIUM risk, %d LOW risk",
+            len(response_content.detections),
+            high_risk,
+            medium_risk,
+            low_risk,
+        )
+
+    def _log_usage(self, response):
+        """
+        Log a response's prompt tokens and how many were served from the prompt cache.
+        
+        Args:
+            response: Chat completion returned by the API
+        """
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = (getattr(details, "cached_tokens", None) or 0) if details else 0
+        self.logger.debug(
+            "Prompt tokens: %d (%d cached), completion tokens: %d",
+            usage.prompt_tokens, cached, usage.completion_tokens,
+        )
+
+    def _retry_delay(self, attempt: int, error: Exception = None) -> float:
+        """
+        Compute the wait before the next retry (exponential backoff with full jitter).
+        
+        When the API says how long to wait (Retry-After on a 429 or 503), the
+        delay is at least that long, so the retry does not fail again early.
+        
+        Args:
+            attempt (int): Number of attempts made so far (1-based)
+            error (Exception, optional): The error being retried
+            
+        Returns:
+            float: Seconds to wait before the next attempt
+        """
+        ceiling = min(Config.RETRY_MAX_WAIT, Config.RETRY_MIN_WAIT * 2 ** (attempt - 1))
+        delay = random.uniform(Config.RETRY_MIN_WAIT, max(ceiling, Config.RETRY_MIN_WAIT))
+        retry_after = _retry_after(error) if error is not None else None
+        return max(delay, retry_after) if retry_after else delay
+
+    def _back_off(self, error: Exception, delay: float):
+        """
+        Slow every in-flight request down after a rate limit error.
+        
+        A 429 means the limiters let too much through, so they are paused for the
+        retry delay: other requests wait as well instead of hitting the limit again.
+        
+        Args:
+            error (Exception): The retryable error that was raised
+            delay (float): Seconds until the failed request is retried
+        """
+        if not isinstance(error, _rate_limit_error()):
+            return
+        for limiter in (self.rate_limiter, self.token_limiter):
+            if limiter:
+                limiter.pause(delay)
+
+    def _parse_with_retry(
+        self, messages: List[Dict[str, Any]], response_format=DetectionResponse
+    ):
+        """
+        Call the structured-output completion endpoint, retrying transient errors.
+        
+        Every attempt first takes a token from the rate limiter and its estimated
+        API tokens from the token limiter. Rate limits, server errors, timeouts
+        and connection errors are retried up to Config.MAX_RETRIES attempts in
+        total; other errors are raised immediately.
+        
+        Args:
+            messages (List[Dict[str, Any]]): Chat messages for the request
+            response_format (optional): Pydantic model the response is parsed
+                into. Defaults to DetectionResponse
+            
+        Returns:
+            The parsed chat completion returned by the API
+        """
+        tokens = _estimate_tokens(messages, self.max_tokens)
+        for attempt in range(1, Config.MAX_RETRIES + 1):
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            if self.token_limiter:
+                self.token_limiter.acquire(tokens)
+            try:
+                response = self.client.chat.completions.parse(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                    response_format=response_format,
+                    # Sent as a raw body field: the locked SDK predates the
+                    # prompt_cache_key keyword argument
+                    extra_body={"prompt_cache_key": self.prompt_cache_key},
+                )
+                self._log_usage(response)
+                return response
+            except _retryable_errors() as e:
+                if attempt == Config.MAX_RETRIES:
+                    raise
+                delay = self._retry_delay(attempt, e)
+                self.logger.warning(
+                    "API call failed (%s), retrying in %.1fs (attempt %d/%d)",
+                    e, delay, attempt, Config.MAX_RETRIES,
+                )
+                self._back_off(e, delay)
+                time.sleep(delay)
+
+    async def _parse_with_retry_async(
+        self,
+        messages: List[Dict[str, Any]],
+        session: _AsyncClientSession,
+        response_format=DetectionResponse,
+    ):
+        """
+        Async counterpart of _parse_with_retry.
+        
+        Backoff waits use asyncio.sleep so other in-flight slides keep running.
+        
+        Args:
+            messages (List[Dict[str, Any]]): Chat messages for the request
+            session (_AsyncClientSession): Holds the async client to send it with
+            response_format (optional): Pydantic model the response is parsed
+                into. Defaults to DetectionResponse
+            
+        Returns:
+            The parsed chat completion returned by the API
+        """
+        tokens = _estimate_tokens(messages, self.max_tokens)
+        for attempt in range(1, Config.MAX_RETRIES + 1):
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async()
+            if self.token_limiter:
+                await self.token_limiter.acquire_async(tokens)
+            try:
+                response = await session.client.chat.completions.parse(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                    response_format=response_format,
+                    # Sent as a raw body field: the locked SDK predates the
+                    # prompt_cache_key keyword argument
+                    extra_body={"prompt_cache_key": self.prompt_cache_key},
+                )
+                self._log_usage(response)
+                return response
+            except _retryable_errors() as e:
+                if attempt == Config.MAX_RETRIES:
+                    raise
+                delay = self._retry_delay(attempt, e)
+                self.logger.warning(
+                    "API call failed (%s), retrying in %.1fs (attempt %d/%d)",
+                    e, delay, attempt, Config.MAX_RETRIES,
+                )
+                self._back_off(e, delay)
+                await asyncio.sleep(delay)
 
     def analyze_slide(
-        self, slide_text: List[str], image_path: str
+        self, slide_text: List[str], image_path: Optional[str], force_refresh: bool = None
     ) -> DetectionResponse:
         """
         Analyze a single slide's content for sensitive information.
@@ -163,7 +890,10 @@ class OpenAIAnalyzer:
         
         Args:
             slide_text (List[str]): List of text strings extracted from the slide
-            image_path (str): Path to the slide image file for visual analysis
+            image_path (Optional[str]): Path to the slide image file for visual
+                analysis, or None to analyze the text alone
+            force_refresh (bool, optional): Bypass the response cache.
+                Defaults to self.force_refresh
             
         Returns:
             DetectionResponse: Structured response containing detected sensitive
@@ -173,75 +903,616 @@ class OpenAIAnalyzer:
             Exception: If API call fails or image cannot be processed
         """
         try:
+            key, cached = self._cache_lookup(slide_text, image_path, force_refresh)
+            if cached is not None:
+                self.logger.info("Using cached analysis for %s", image_path)
+                return cached
+
             self.logger.info(
                 "Analyzing slide with %d text elements", len(slide_text)
             )
 
-            # Encode the image
-            base64_image = self._encode_image(image_path)
-
-            # Prepare the system prompt with extracted text
-            user_prompt = self._prepare_user_prompt(slide_text)
-
-            # Create the messages for OpenAI API
-            messages = [
-                {"role": "system", "content": self.system_prompt},
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": user_prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{base64_image}"
-                            },
-                        },
-                    ],
-                },
-            ]
+            messages = self._build_messages(slide_text, image_path)
 
             # Make the API call
-            response = self.client.chat.completions.parse(
-                model=self.model,
-                messages=messages,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                response_format=DetectionResponse,
-            )
+            response = self._parse_with_retry(messages)
 
             # Parse the response
             response_content = response.choices[0].message.parsed
+            self._log_detection_summary(response_content)
 
-            # Log summary of detections
-            if response_content and response_content.detections:
-                high_risk = sum(
-                    1
-                    for d in response_content.detections
-                    if d.sensitivity_level == "HIGH"
-                )
-                medium_risk = sum(
-                    1
-                    for d in response_content.detections
-                    if d.sensitivity_level == "MEDIUM"
-                )
-                low_risk = sum(
-                    1
-                    for d in response_content.detections
-                    if d.sensitivity_level == "LOW"
-                )
+            if key is not None:
+                self.response_cache.put(key, response_content)
+            return response_content
+
+        except Exception as e:
+            self.logger.error("Error analyzing slide: %s", e)
+            raise
 
-                self.logger.info(
-                    f"Found {len(response_content.detections)} detections: "
-                    f"{high_risk} HIGH risk, {medium_risk} MEDIUM risk, "
-                    f"{low_risk} LOW risk"
+    async def analyze_slide_async(
+        self,
+        slide_text: List[str],
+        image_path: Optional[str],
+        force_refresh: bool = None,
+        session: _AsyncClientSession = None,
+    ) -> DetectionResponse:
+        """
+        Asynchronously analyze a single slide's content for sensitive information.
+        
+        Same as analyze_slide, but awaits the API call on the async client so
+        several slides can be analyzed concurrently on one event loop.
+        
+        Args:
+            slide_text (List[str]): List of text strings extracted from the slide
+            image_path (Optional[str]): Path to the slide image file for visual
+                analysis, or None to analyze the text alone
+            force_refresh (bool, optional): Bypass the response cache.
+                Defaults to self.force_refresh
+            session (_AsyncClientSession, optional): Client session shared with
+                other requests of the same call. Defaults to one of its own
+            
+        Returns:
+            DetectionResponse: Structured response containing detected sensitive
+                information with categories, sensitivity levels, and replacements
+                
+        Raises:
+            Exception: If API call fails or image cannot be processed
+        """
+        if session is None:
+            async with _AsyncClientSession(self._new_async_client) as session:
+                return await self.analyze_slide_async(
+                    slide_text, image_path, force_refresh, session
                 )
 
+        try:
+            # Hashing reads the image, so it runs off the event loop too
+            key, cached = await asyncio.to_thread(
+                self._cache_lookup, slide_text, image_path, force_refresh
+            )
+            if cached is not None:
+                self.logger.info("Using cached analysis for %s", image_path)
+                return cached
+
+            self.logger.info(
+                "Analyzing slide with %d text elements", len(slide_text)
+            )
+
+            # Image decoding and resampling release the GIL, so encode in a worker
+            # thread; slides encode in parallel and the event loop keeps serving
+            # the requests already in flight
+            messages = await asyncio.to_thread(
+                self._build_messages, slide_text, image_path
+            )
+
+            response = await self._parse_with_retry_async(messages, session)
+
+            response_content = response.choices[0].message.parsed
+            self._log_detection_summary(response_content)
+
+            if key is not None:
+                # The cache entry is a file write; keep it off the event loop
+                await asyncio.to_thread(self.response_cache.put, key, response_content)
             return response_content
 
         except Exception as e:
             self.logger.error("Error analyzing slide: %s", e)
             raise
 
+    async def _analyze_one(
+        self,
+        session: _AsyncClientSession,
+        semaphore: asyncio.Semaphore,
+        index: int,
+        slide_text: List[str],
+        image_path: Optional[str],
+        on_result: Callable[[int, DetectionResponse], None] = None,
+    ) -> Optional[DetectionResponse]:
+        """
+        Analyze one slide while holding a slot of the concurrency semaphore.
+        
+        Args:
+            session (_AsyncClientSession): Client session of the calling batch
+            semaphore (asyncio.Semaphore): Semaphore bounding in-flight requests
+            index (int): Position of the slide in the analyzed items
+            slide_text (List[str]): List of text strings extracted from the slide
+            image_path (Optional[str]): Path to the slide image file, or None
+            on_result (Callable, optional): Called with (index, response) as soon
+                as the slide's analysis succeeds
+            
+        Returns:
+            Optional[DetectionResponse]: Parsed response, or None if analysis failed
+        """
+        async with semaphore:
+            try:
+                response = await self.analyze_slide_async(
+                    slide_text, image_path, session=session
+                )
+            except Exception:
+                # Already logged by analyze_slide_async; keep the other slides going
+                return None
+        if on_result:
+            on_result(index, response)
+        return response
+
+    async def analyze_slide_group_async(
+        self,
+        items: List[Tuple[List[str], str]],
+        session: _AsyncClientSession = None,
+    ) -> List[Optional[DetectionResponse]]:
+        """
+        Analyze several slides with a single request.
+        
+        Sharing one request amortizes the system prompt and the round-trip over
+        the whole group. Slides with a cached response are left out of the request.
+        
+        Args:
+            items (List[Tuple[List[str], str]]): (slide_text, image_path) pairs
+            session (_AsyncClientSession, optional): Client session shared with
+                other requests of the same call. Defaults to one of its own
+            
+        Returns:
+            List[Optional[DetectionResponse]]: One result per item, in input order;
+                None for slides missing from the response
+                
+        Raises:
+            Exception: If API call fails or an image cannot be processed
+        """
+        if session is None:
+            async with _AsyncClientSession(self._new_async_client) as session:
+                return await self.analyze_slide_group_async(items, session)
+
+        lookups = [
+            await asyncio.to_thread(self._cache_lookup, slide_text, image_path)
+            for slide_text, image_path in items
+        ]
+        results = [cached for _, cached in lookups]
+        pending = [i for i, cached in enumerate(results) if cached is None]
+        if not pending:
+            return results
+
+        self.logger.info("Analyzing %d slides in one request", len(pending))
+
+        messages = await asyncio.to_thread(
+            self._build_group_messages, [items[i] for i in pending]
+        )
+        response = await self._parse_with_retry_async(
+            messages, session, response_format=BatchDetectionResponse
+        )
+
+        by_number = {
+            slide.slide_number: DetectionResponse(detections=slide.detections)
+            for slide in response.choices[0].message.parsed.slides
+        }
+        entries = []
+        for number, i in enumerate(pending, start=1):
+            result = by_number.get(number)
+            if result is None:
+                continue
+            self._log_detection_summary(result)
+            key = lookups[i][0]
+            if key is not None:
+                entries.append((key, result))
+            results[i] = result
+        if entries:
+            # The group's cache entries are written in one trip off the event loop
+            await asyncio.to_thread(
+                lambda: [self.response_cache.put(key, result) for key, result in entries]
+            )
+        return results
+
+    async def _analyze_group(
+        self,
+        session: _AsyncClientSession,
+        semaphore: asyncio.Semaphore,
+        indices: List[int],
+        items: List[Tuple[List[str], str]],
+        on_result: Callable[[int, DetectionResponse], None] = None,
+    ) -> List[Tuple[int, Optional[DetectionResponse]]]:
+        """
+        Analyze a group of slides in one request, falling back to one per slide.
+        
+        Slides the group response does not cover (or all of them, if the group
+        request fails) are re-analyzed with single-slide requests.
+        
+        Args:
+            session (_AsyncClientSession): Client session of the calling batch
+            semaphore (asyncio.Semaphore): Semaphore bounding in-flight requests
+            indices (List[int]): Positions in items of the slides in this group
+            items (List[Tuple[List[str], str]]): All (slide_text, image_path) pairs
+            on_result (Callable, optional): Per-slide completion callback
+            
+        Returns:
+            List[Tuple[int, Optional[DetectionResponse]]]: (index, result) pairs
+        """
+        if len(indices) == 1:
+            index = indices[0]
+            return [
+                (
+                    index,
+                    await self._analyze_one(
+                        session, semaphore, index, *items[index], on_result
+                    ),
+                )
+            ]
+
+        async with semaphore:
+            try:
+                responses = await self.analyze_slide_group_async(
+                    [items[index] for index in indices], session
+                )
+            except Exception as e:
+                self.logger.warning(
+                    "Multi-slide request failed (%s), analyzing slides one by one", e
+                )
+                responses = [None] * len(indices)
+
+        results = []
+        missing = []
+        for index, response in zip(indices, responses):
+            if response is None:
+                missing.append(index)
+            else:
+                if on_result:
+                    on_result(index, response)
+                results.append((index, response))
+
+        retried = await asyncio.gather(
+            *[
+                self._analyze_one(session, semaphore, index, *items[index], on_result)
+                for index in missing
+            ]
+        )
+        return results + list(zip(missing, retried))
+
+    def _group_indices(self, items: List[Tuple[List[str], str]]) -> List[List[int]]:
+        """
+        Split items into consecutive groups for multi-slide requests.
+        
+        A group holds at most self.slides_per_request slides and, unless it is a
+        single slide, at most Config.MAX_REQUEST_TEXT_CHARS characters of text.
+        Slides without an image are grouped separately, up to
+        Config.TEXT_ONLY_SLIDES_PER_REQUEST of them: without an image, the shared
+        prompt is most of a request's tokens.
+        
+        Args:
+            items (List[Tuple[List[str], str]]): (slide_text, image_path) pairs
+            
+        Returns:
+            List[List[int]]: Groups of item indices
+        """
+        groups = []
+        # Open group, its text length and its size limit, per kind of slide
+        open_groups = {
+            True: [[], 0, self.slides_per_request],
+            False: [
+                [], 0, max(self.slides_per_request, Config.TEXT_ONLY_SLIDES_PER_REQUEST)
+            ],
+        }
+        for index, (slide_text, image_path) in enumerate(items):
+            state = open_groups[image_path is not None]
+            group, group_chars, limit = state
+            chars = sum(map(len, slide_text))
+            if group and (
+                len(group) == limit
+                or group_chars + chars > Config.MAX_REQUEST_TEXT_CHARS
+            ):
+                groups.append(group)
+                group = state[0] = []
+                group_chars = 0
+            group.append(index)
+            state[1] = group_chars + chars
+        groups.extend(state[0] for state in open_groups.values() if state[0])
+        return groups
+
+    @staticmethod
+    def _duplicate_indices(items: List[Tuple[List[str], str]]) -> Dict[int, List[int]]:
+        """
+        Find slides whose text and image are identical to an earlier slide's.
+        
+        Such slides would send the same request, so one analysis serves them all.
+        Images are only hashed for slides whose text repeats, since distinct text
+        already rules out a duplicate.
+        
+        Args:
+            items (List[Tuple[List[str], str]]): (slide_text, image_path) pairs
+            
+        Returns:
+            Dict[int, List[int]]: Positions of the repeats, keyed by the position
+                of the slide they repeat
+        """
+        by_text = {}
+        for index, (slide_text, _) in enumerate(items):
+            by_text.setdefault(tuple(slide_text), []).append(index)
+
+        copies = {}
+        for indices in by_text.values():
+            if len(indices) < 2:
+                continue
+            first_by_image = {}
+            for index in indices:
+                image = _image_identity(items[index][1])
+                first = first_by_image.setdefault(image, index)
+                if first != index:
+                    copies.setdefault(first, []).append(index)
+        return copies
+
+    async def analyze_slides_async(
+        self,
+        items: List[Tuple[List[str], str]],
+        concurrency: int = None,
+        on_result: Callable[[int, DetectionResponse], None] = None,
+    ) -> List[Optional[DetectionResponse]]:
+        """
+        Analyze several slides concurrently on the running event loop.
+        
+        Coroutine form of analyze_slides, for callers that already run an event
+        loop (where asyncio.run is not available).
+        
+        Args:
+            items (List[Tuple[List[str], str]]): (slide_text, image_path) pairs
+            concurrency (int, optional): Maximum number of in-flight requests.
+                Defaults to self.max_concurrency
+            on_result (Callable, optional): Per-slide completion callback
+            
+        Returns:
+            List[Optional[DetectionResponse]]: Results in the same order as items
+        """
+        if not items:
+            return []
+
+        # Repeated slides (dividers, agendas, templates) are analyzed once
+        copies = await asyncio.to_thread(self._duplicate_indices, items)
+        repeated = {copy for indices in copies.values() for copy in indices}
+        unique = [index for index in range(len(items)) if index not in repeated]
+        if len(unique) < len(items):
+            self.logger.info(
+                "%d slides repeat an earlier slide, reusing its analysis",
+                len(items) - len(unique),
+            )
+            if on_result:
+                report = on_result
+
+                def on_result(index: int, response: DetectionResponse) -> None:
+                    report(index, response)
+                    for copy in copies.get(index, ()):
+                        report(copy, response)
+
+        semaphore = asyncio.Semaphore(concurrency or self.max_concurrency)
+        async with _AsyncClientSession(self._new_async_client) as session:
+            grouped = await asyncio.gather(
+                *[
+                    self._analyze_group(
+                        session,
+                        semaphore,
+                        [unique[i] for i in indices],
+                        items,
+                        on_result,
+                    )
+                    for indices in self._group_indices([items[i] for i in unique])
+                ]
+            )
+
+        results = [None] * len(items)
+        for group in grouped:
+            for index, response in group:
+                results[index] = response
+                for copy in copies.get(index, ()):
+                    results[copy] = response
+        return results
+
+    def analyze_slides(
+        self,
+        items: List[Tuple[List[str], str]],
+        concurrency: int = None,
+        on_result: Callable[[int, DetectionResponse], None] = None,
+    ) -> List[Optional[DetectionResponse]]:
+        """
+        Analyze several slides concurrently.
+        
+        Slide analysis is dominated by network latency, so the requests are
+        issued concurrently with at most `concurrency` of them in flight at once.
+        With slides_per_request > 1, consecutive slides share one request.
+        Slides with the same text and image as an earlier slide are not sent
+        again; they get that slide's result.
+        
+        Args:
+            items (List[Tuple[List[str], str]]): (slide_text, image_path) pairs,
+                one per slide
+            concurrency (int, optional): Maximum number of in-flight requests.
+                Defaults to self.max_concurrency
+            on_result (Callable, optional): Called with (item index, response) as
+                each slide completes, e.g. to checkpoint results progressively
+                
+        Returns:
+            List[Optional[DetectionResponse]]: One result per item, in input order.
+                Slides whose analysis failed are returned as None.
+        """
+        if not items:
+            return []
+
+        return asyncio.run(self.analyze_slides_async(items, concurrency, on_result))
+
+    def _build_batch_request(
+        self, slide_number: int, slide_text: List[str], image_path: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Build one JSONL line of a Batch API input file.
+        
+        Args:
+            slide_number (int): Slide number, used as the request's custom_id
+            slide_text (List[str]): List of text strings extracted from the slide
+            image_path (Optional[str]): Path to the slide image file, or None
+            
+        Returns:
+            Dict[str, Any]: Batch request with the same body as analyze_slide sends
+        """
+        from openai.lib._parsing._completions import type_to_response_format_param
+
+        return {
+            "custom_id": f"slide-{slide_number}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": self.model,
+                "messages": self._build_messages(slide_text, image_path),
+                "max_tokens": self.max_tokens,
+                "temperature": self.temperature,
+                "response_format": type_to_response_format_param(DetectionResponse),
+                "prompt_cache_key": self.prompt_cache_key,
+            },
+        }
+
+    def submit_batch(self, items: List[Tuple[int, List[str], str]]) -> str:
+        """
+        Upload a Batch API input file for the given slides and start the batch.
+        
+        The returned ID is all fetch_batch needs, so it can be stored and the
+        results collected by a later process.
+        
+        Args:
+            items (List[Tuple[int, List[str], str]]): (slide_number, slide_text,
+                image_path) triples
+                
+        Returns:
+            str: ID of the created batch
+        """
+        def build_line(item: Tuple[int, List[str], str]) -> str:
+            return json.dumps(self._build_batch_request(*item), ensure_ascii=False)
+
+        # Slide images are encoded in parallel; map keeps the input order
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            lines = list(executor.map(build_line, items))
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+        input_file = self.client.files.create(
+            file=("slides_batch.jsonl", io.BytesIO(payload)), purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        self.logger.info("Submitted batch %s with %d slides", batch.id, len(items))
+        return batch.id
+
+    def fetch_batch(
+        self, batch_id: str, poll_interval: float = None
+    ) -> Dict[int, DetectionResponse]:
+        """
+        Poll a batch until it finishes and parse its output file.
+        
+        Args:
+            batch_id (str): ID of the batch to wait for, from submit_batch
+            poll_interval (float, optional): Seconds to sleep between status
+                checks. Defaults to Config.BATCH_POLL_INTERVAL
+            
+        Returns:
+            Dict[int, DetectionResponse]: Parsed responses keyed by slide number.
+                Slides whose request failed are omitted.
+                
+        Raises:
+            RuntimeError: If the batch does not complete successfully
+        """
+        poll_interval = poll_interval or Config.BATCH_POLL_INTERVAL
+        batch = self.client.batches.retrieve(batch_id)
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            self.logger.info("Batch %s status: %s", batch_id, batch.status)
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch_id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch_id} ended with status {batch.status}")
+
+        results = {}
+        for slide_number, record in self._batch_records(batch.output_file_id):
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                self._log_batch_failure(slide_number, record)
+                continue
+
+            # One unusable answer (refused, truncated, off-schema) only loses
+            # its own slide, not the rest of the paid batch
+            message = {}
+            try:
+                message = response["body"]["choices"][0]["message"]
+                response_content = DetectionResponse.model_validate_json(
+                    message["content"] or ""
+                )
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                self.logger.error(
+                    "Batch response for slide %d could not be parsed: %s",
+                    slide_number,
+                    message.get("refusal") or e,
+                )
+                continue
+            self._log_detection_summary(response_content)
+            results[slide_number] = response_content
+
+        # Requests that failed outright are listed in a separate error file
+        for slide_number, record in self._batch_records(batch.error_file_id):
+            self._log_batch_failure(slide_number, record)
+
+        return results
+
+    def _batch_records(self, file_id: Optional[str]):
+        """
+        Read the JSONL records of a batch output or error file.
+        
+        Args:
+            file_id (Optional[str]): ID of the file, or None if the batch has none
+            
+        Yields:
+            Tuple[int, Dict[str, Any]]: Slide number and record of each readable
+                line; unreadable lines are logged and skipped
+        """
+        if not file_id:
+            return
+        for line in self.client.files.content(file_id).text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                slide_number = int(record["custom_id"].split("-", 1)[1])
+            except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+                self.logger.error("Skipping unreadable batch record: %s", e)
+                continue
+            yield slide_number, record
+
+    def _log_batch_failure(self, slide_number: int, record: Dict[str, Any]):
+        """Log the error of a batch request that did not succeed."""
+        response = record.get("response") or {}
+        self.logger.error(
+            "Batch request for slide %d failed: %s",
+            slide_number,
+            record.get("error") or response.get("body"),
+        )
+
+    def run_batch(
+        self,
+        items: List[Tuple[int, List[str], str]],
+        poll_interval: float = None,
+    ) -> Dict[int, DetectionResponse]:
+        """
+        Analyze slides through the OpenAI Batch API.
+        
+        Batch requests are billed at a discount and do not count against the
+        real-time rate limits, at the cost of latency (up to the 24h completion
+        window). Intended for non-interactive runs over large decks.
+        
+        Args:
+            items (List[Tuple[int, List[str], str]]): (slide_number, slide_text,
+                image_path) triples
+            poll_interval (float, optional): Seconds between status checks.
+                Defaults to Config.BATCH_POLL_INTERVAL
+                
+        Returns:
+            Dict[int, DetectionResponse]: Parsed responses keyed by slide number
+        """
+        if not items:
+            return {}
+
+        return self.fetch_batch(self.submit_batch(items), poll_interval)
+
     def get_sanitization_summary(
         self, detections: List[OpenAIDetection]
     ) -> Dict[str, Any]:
@@ -263,32 +1534,11 @@ class OpenAIAnalyzer:
                 - detections (List[Dict]): Detailed list of all detections with
                 original text, replacement, category, reason, and sensitivity level
         """
-        categories = {}
-        sensitivity_levels = {}
-
-        for detection in detections:
-            # Count categories
-            if detection.category not in categories:
-                categories[detection.category] = 0
-            categories[detection.category] += 1
-
-            # Count sensitivity levels
-            if detection.sensitivity_level not in sensitivity_levels:
-                sensitivity_levels[detection.sensitivity_level] = 0
-            sensitivity_levels[detection.sensitivity_level] += 1
-
         return {
             "total_detections": len(detections),
-            "categories": categories,
-            "sensitivity_levels": sensitivity_levels,
-            "detections": [
-                {
-                    "original": d.original,
-                    "replacement": d.replacement,
-                    "category": d.category,
-                    "reason": d.reason,
-                    "sensitivity_level": d.sensitivity_level,
-                }
-                for d in detections
-            ],
+            "categories": dict(Counter(d.category for d in detections)),
+            "sensitivity_levels": dict(
+                Counter(d.sensitivity_level for d in detections)
+            ),
+            "detections": _DETECTION_LIST.dump_python(detections),
         }
@@ -8,15 +8,201 @@ Comprehensive class for PowerPoint file processing including:
 - File manipulation and sanitized output generation
 """
 
+import contextlib
+import copy
+import io
 import logging
-from typing import List, Dict, Any, Tuple
+import math
+import os
+import zipfile
+from bisect import bisect_right
+from collections import deque
+from functools import lru_cache
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from lxml import etree
 
 from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+from pptx.oxml.text import CT_RegularTextRun
+from pptx.text.text import TextFrame
 
 from ..models.slide_data import SlideData
 from ..models.detection import Detection
-from ..utils.text_processing import TextProcessor
+from ..utils.text_processing import (
+    ReplacementMatcher,
+    TextProcessor,
+    build_replacement_matcher,
+)
+from config import Config
+
+
+_NAMESPACES = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+}
+
+# Text bodies of shapes (p:sp, also inside p:grpSp) and of table cells
+_TEXT_BODIES_XPATH = etree.XPath(
+    "./p:cSld/p:spTree//p:sp/p:txBody"
+    " | ./p:cSld/p:spTree//a:tbl/a:tr/a:tc/a:txBody",
+    namespaces=_NAMESPACES,
+)
+
+# Paragraphs of a text body with the pieces of their text (run and field <a:t>,
+# line breaks), in document order
+_BODY_TEXT_XPATH = etree.XPath(
+    "./a:p | ./a:p/a:r/a:t | ./a:p/a:fld/a:t | ./a:p/a:br", namespaces=_NAMESPACES
+)
+
+# Text bodies of a table graphic frame's cells, row by row
+_CELL_BODIES_XPATH = etree.XPath(
+    "./a:graphic/a:graphicData/a:tbl/a:tr/a:tc/a:txBody", namespaces=_NAMESPACES
+)
+
+# Text elements of a text body's runs, in document order. One compiled query
+# replaces a paragraph proxy, an r_lst child scan and a t lookup per run
+_RUN_TEXTS_XPATH = etree.XPath("./a:p/a:r/a:t", namespaces=_NAMESPACES)
+
+# Placeholder element of a shape, compiled once (python-pptx's is_placeholder
+# and placeholder_format evaluate an XPath string on every access)
+_PLACEHOLDER_XPATH = etree.XPath("./*[1]/p:nvPr/p:ph", namespaces=_NAMESPACES)
+
+# Shape elements told apart by tag instead of python-pptx's shape_type, which
+# for autoshapes runs several XPath queries per call
+_SP_TAG = qn("p:sp")
+_GROUP_TAG = qn("p:grpSp")
+# Only these can be a picture, chart or table; connectors and ink (contentPart)
+# are never counted
+_COUNTED_TAGS = frozenset((qn("p:pic"), qn("p:graphicFrame")))
+_BR_TAG = qn("a:br")
+_P_TAG = qn("a:p")
+_T_TAG = qn("a:t")
+_TXBODY_TAG = qn("p:txBody")
+
+# Segment marker for paragraph and line breaks in _patch_runs
+_BREAK = object()
+
+# (original, replacement) getter per detection class, chosen on first sight
+_PAIR_GETTERS: Dict[type, attrgetter] = {}
+
+
+def _load_presentation(file_path: str):
+    """
+    Load a presentation from a single sequential read of the file.
+    
+    zipfile otherwise issues many small seek/read calls against the file (central
+    directory, then every member), which is slow on network filesystems. python-pptx
+    loads every part into memory anyway, so buffering the whole file costs nothing extra.
+    
+    Args:
+        file_path (str): Path to the PowerPoint file
+        
+    Returns:
+        The loaded python-pptx Presentation
+    """
+    with open(file_path, "rb") as f:
+        return Presentation(io.BytesIO(f.read()))
+
+
+def _write_file(file_path: str, data) -> None:
+    """
+    Write a complete file with one write call and flush it to disk.
+    
+    zipfile issues many small writes per member; building the archive in memory
+    and writing it at once avoids those round-trips on slow or network storage.
+    The data goes to a temporary file next to the target, which is then renamed
+    over it, so a crash never leaves a truncated file at file_path.
+    
+    Args:
+        file_path (str): Path of the file to (over)write
+        data: Bytes-like content of the file
+    """
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _body_text(txBody) -> str:
+    """
+    Read the text of a text body straight from its XML.
+    
+    Gives the same string as python-pptx's TextFrame.text (paragraphs joined
+    by newlines, line breaks as vertical tabs) without building paragraph and
+    run proxies.
+    
+    Args:
+        txBody: A <p:txBody> or <a:txBody> element
+        
+    Returns:
+        str: Text of the body
+    """
+    pieces = []
+    for element in _BODY_TEXT_XPATH(txBody):
+        tag = element.tag
+        if tag == _T_TAG:
+            pieces.append(element.text or "")
+        elif tag == _BR_TAG:
+            pieces.append("\v")
+        else:
+            pieces.append("\n")  # a:p, which separates it from the previous one
+    return "".join(pieces)[1:]
+
+
+def _parse_slide_range(file_path: str, start: int, stop: int) -> List[SlideData]:
+    """
+    Parse slides [start, stop) of a presentation in a worker process.
+    
+    Each worker opens its own copy of the presentation, since python-pptx
+    objects cannot be shared across processes.
+    
+    Args:
+        file_path (str): Path to the PowerPoint file
+        start (int): 0-based index of the first slide to parse
+        stop (int): 0-based index one past the last slide to parse
+        
+    Returns:
+        List[SlideData]: Parsed slides, in order
+    """
+    processor = PPTXProcessor()
+    slides = _load_presentation(file_path).slides
+    return [processor._parse_slide(slides[idx], idx + 1) for idx in range(start, stop)]
+
+
+@lru_cache(maxsize=32)
+def _cached_parse(
+    file_path: str, mtime_ns: int, size: int, max_workers: int
+) -> Tuple[SlideData, ...]:
+    """
+    Parse a presentation once per (path, mtime, size) and reuse the result.
+    
+    The sanitizer pipeline parses the deck for analysis and later re-reads the
+    same unchanged file; the modification time and size make a stale hit unlikely.
+    The cached slides are shared, so parse_presentation hands out copies.
+    
+    Args:
+        file_path (str): Absolute path to the PowerPoint file
+        mtime_ns (int): File modification time in nanoseconds
+        size (int): File size in bytes
+        max_workers (int): Worker process limit for large decks
+        
+    Returns:
+        Tuple[SlideData, ...]: Parsed slides, in order
+    """
+    return tuple(PPTXProcessor(max_workers)._parse_presentation_file(file_path))
 
 
 class PPTXProcessor:
@@ -32,22 +218,79 @@ class PPTXProcessor:
     Attributes:
         logger: Logger instance for tracking operations
         text_processor: TextProcessor instance for advanced text operations
+        max_workers: Maximum number of processes used to parse large decks
     """
 
-    def __init__(self):
+    def __init__(self, max_workers: int = None):
+        """
+        Initialize the processor.
+        
+        Args:
+            max_workers (int, optional): Maximum number of worker processes for
+                parse_presentation. Defaults to Config.PARSE_MAX_WORKERS, or the
+                CPU count when that is unset
+        """
         self.logger = logging.getLogger(__name__)
         self.text_processor = TextProcessor()
+        self.max_workers = max_workers or Config.PARSE_MAX_WORKERS or os.cpu_count() or 1
+        # Per-type handlers for _process_shape, resolved with one dict lookup
+        self._shape_handlers = {
+            MSO_SHAPE_TYPE.PICTURE: self._count_picture,
+            MSO_SHAPE_TYPE.CHART: self._count_chart,
+            MSO_SHAPE_TYPE.TABLE: self._process_table,
+        }
+        # Flattened text frame lists per slide, dropped along with their presentation
+        self._slide_text_frames = WeakKeyDictionary()
+        # Raw .pptx contents of presentations from load_presentation, keyed on
+        # their (hashable) presentation part
+        self._source_bytes = WeakKeyDictionary()
+        # Zip member each slide part was loaded from, keyed on the slide part
+        self._source_members = WeakKeyDictionary()
 
-    def parse_presentation(self, file_path: str) -> List[SlideData]:
+    def load_presentation(self, file_path: str):
+        """
+        Load a presentation so it can be both parsed and sanitized.
+        
+        Passing the result to parse_presentation and apply_replacements reads and
+        unzips the file once for the whole pipeline. The raw file contents are
+        kept alongside, so apply_replacements can patch them without rereading
+        the file.
+        
+        Args:
+            file_path (str): Path to the PowerPoint file
+            
+        Returns:
+            The loaded python-pptx Presentation
+        """
+        with open(file_path, "rb") as f:
+            data = f.read()
+        presentation = Presentation(io.BytesIO(data))
+        # Kept for _save_patched, so saving does not read the source file again
+        self._source_bytes[presentation.part] = data
+        # Presentation.slides renames slide parts after their position in the
+        # deck, so record the member names first, while they still match the file
+        for rel in presentation.part.rels.values():
+            if rel.reltype == RT.SLIDE and not rel.is_external:
+                part = rel.target_part
+                self._source_members[part] = part.partname.lstrip("/")
+        self.logger.info(f"Loaded presentation: {file_path}")
+        return presentation
+
+    def parse_presentation(self, file_path: str, presentation=None) -> List[SlideData]:
         """
         Parse a PowerPoint file and return structured slide data.
         
         Extracts content from all slides including text, images, charts, and tables.
         Each slide is processed to create a SlideData object containing all relevant
-        information for analysis and sanitization.
+        information for analysis and sanitization. Large decks are split into slide
+        ranges parsed by a process pool (slide parsing is CPU-bound and holds the GIL).
+        Results are cached per file version, so re-parsing an unchanged file is free.
         
         Args:
             file_path (str): Path to the PowerPoint file to parse
+            presentation (optional): The file already loaded with load_presentation.
+                When given it is parsed directly instead of loading the file again
+                (and the parse cache is bypassed)
             
         Returns:
             List[SlideData]: List of SlideData objects, one for each slide
@@ -56,23 +299,27 @@ class PPTXProcessor:
             Exception: If the presentation cannot be loaded or parsed
         """
         try:
-            # Load presentation
-            presentation = Presentation(file_path)
-            self.logger.info(
-                f"Loaded presentation with {len(presentation.slides)} slides"
-            )
-
-            slides_data = []
-
-            # Process each slide
-            for slide_idx, slide in enumerate(presentation.slides):
-                slide_number = slide_idx + 1
-                slide_data = self._parse_slide(slide, slide_number)
-                slides_data.append(slide_data)
-
-                self.logger.info(
-                    f"Parsed slide {slide_number}: {len(slide_data.text_content)} text elements"
+            if presentation is not None:
+                slides_data = self._parse_presentation_file(file_path, presentation)
+            else:
+                stat = os.stat(file_path)
+                cached = _cached_parse(
+                    os.path.abspath(file_path),
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    self.max_workers,
                 )
+                # Callers own (and may edit) the slides they get; the cached
+                # ones are shared by every later parse of the same file
+                slides_data = list(copy.deepcopy(cached))
+
+            if self.logger.isEnabledFor(logging.INFO):
+                for slide_data in slides_data:
+                    self.logger.info(
+                        "Parsed slide %d: %d text elements",
+                        slide_data.slide_number,
+                        len(slide_data.text_content),
+                    )
 
             return slides_data
 
@@ -80,12 +327,70 @@ class PPTXProcessor:
             self.logger.error(f"Failed to parse presentation: {e}")
             raise
 
+    def _parse_presentation_file(
+        self, file_path: str, presentation=None
+    ) -> List[SlideData]:
+        """
+        Parse every slide of a presentation, bypassing the parse cache.
+        
+        Args:
+            file_path (str): Path to the PowerPoint file to parse
+            presentation (optional): The file's already loaded presentation
+            
+        Returns:
+            List[SlideData]: List of SlideData objects, one for each slide
+        """
+        # Load presentation
+        if presentation is None:
+            presentation = _load_presentation(file_path)
+        self.logger.info(
+            f"Loaded presentation with {len(presentation.slides)} slides"
+        )
+
+        slide_count = len(presentation.slides)
+        workers = min(
+            self.max_workers, slide_count // Config.PARSE_MIN_SLIDES_PER_WORKER
+        )
+
+        if workers > 1:
+            # Each worker re-opens the file and parses one contiguous range. One
+            # range per worker rather than one task per slide: opening the
+            # package costs about as much as parsing dozens of slides
+            chunk_size = math.ceil(slide_count / workers)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _parse_slide_range,
+                        str(file_path),
+                        start,
+                        min(start + chunk_size, slide_count),
+                    )
+                    for start in range(0, slide_count, chunk_size)
+                ]
+                slides_data = [
+                    slide_data
+                    for future in futures
+                    for slide_data in future.result()
+                ]
+        else:
+            # Process each slide
+            slides_data = [
+                self._parse_slide(slide, slide_idx + 1)
+                for slide_idx, slide in enumerate(presentation.slides)
+            ]
+
+        return slides_data
+
     def _parse_slide(self, slide, slide_number: int) -> SlideData:
         """
         Parse a single slide and extract all relevant content.
         
-        Processes all shapes on the slide to extract text content, count elements,
-        and gather metadata. Creates a comprehensive SlideData object.
+        Processes all shapes on the slide in a single pass to extract text content,
+        count elements, and gather metadata (the title is taken from the title
+        placeholder met along the way). Creates a comprehensive SlideData object.
+        Shapes are walked as XML elements and their text is read from the XML;
+        python-pptx proxies are only built for the less common non-autoshapes,
+        whose type decides how they are counted.
         
         Args:
             slide: The python-pptx slide object to parse
@@ -95,21 +400,208 @@ class PPTXProcessor:
             SlideData: Object containing all extracted slide information
         """
         slide_data = SlideData(slide_number=slide_number)
+        title_found = False
 
-        # Get slide title
-        try:
-            if slide.shapes.title and slide.shapes.title.text:
-                slide_data.title = slide.shapes.title.text.strip()
-        except:
-            slide_data.title = f"Slide {slide_number}"
+        # Process all shapes, including those nested in groups
+        shapes = slide.shapes
+        for element in self._iter_shape_elements(shapes._spTree):
+            # The title is the first placeholder with idx 0 (as in slide.shapes.title)
+            if not title_found:
+                ph = _PLACEHOLDER_XPATH(element)
+                # idx is probed rather than parsed in a try block; a malformed
+                # value simply does not mark a title
+                idx = ph[0].get("idx", "0") if ph else ""
+                if idx.isdigit() and int(idx) == 0:
+                    title_found = True
+                    # Only autoshapes have a text frame
+                    txBody = element.find(_TXBODY_TAG)
+                    if element.tag == _SP_TAG and txBody is not None:
+                        slide_data.title = _body_text(txBody).strip()
 
-        # Process all shapes
-        for shape in slide.shapes:
-            self._process_shape(shape, slide_data)
+            self._process_shape(element, shapes, slide_data)
 
         return slide_data
 
-    def _process_shape(self, shape, slide_data: SlideData):
+    def _text_frames_of(self, slide) -> List:
+        """
+        Return every text frame on a slide, collecting them only once per slide.
+        
+        Args:
+            slide: The python-pptx slide object
+            
+        Returns:
+            List: Text frames of all shapes and table cells, in document order
+        """
+        # Slide proxies define __eq__ and are unhashable; key on their part instead
+        part = slide.part
+        text_frames = self._slide_text_frames.get(part)
+        if text_frames is None:
+            text_frames = self._slide_text_frames[part] = self._collect_text_frames(
+                slide
+            )
+        return text_frames
+
+    def _collect_text_frames(self, slide) -> List:
+        """
+        Collect all text frames on a slide in a single traversal.
+        
+        The <p:txBody> of shapes (inside groups too) and <a:txBody> of table
+        cells are found with one XPath query over the slide XML, in document
+        order, instead of walking python-pptx shape and cell proxies. Shapes
+        without a text body are skipped rather than given an empty one.
+        
+        Args:
+            slide: The python-pptx slide object
+            
+        Returns:
+            List: Text frames of all shapes and table cells, in document order
+        """
+        return [TextFrame(txBody, slide) for txBody in _TEXT_BODIES_XPATH(slide._element)]
+
+    def _patch_runs(self, paragraphs, spans: List[Tuple[int, int, str, str]]) -> bool:
+        """
+        Splice replacement spans directly into the runs that hold them.
+        
+        Each span's replacement goes into the first run it touches and the matched
+        text is cut from the following runs, so every run keeps its formatting.
+        Paragraph and line breaks inside a span are kept, so a match across lines
+        leaves the paragraph structure intact. Nothing is modified unless all
+        spans can be patched this way.
+        
+        Args:
+            paragraphs: <a:p> elements of the text frame the spans were found in
+            spans (List[Tuple[int, int, str, str]]): (start, end, original,
+                replacement) spans of the text frame's text
+                
+        Returns:
+            bool: True if the runs were patched, False if a span crosses a field
+                or starts on a break
+        """
+        # Lay out the text frame's text as segments, with the run that holds each
+        # (_BREAK for paragraph and line breaks, None for fields)
+        segments = []
+        position = 0
+        for index, paragraph in enumerate(paragraphs):
+            if index:
+                segments.append((position, position + 1, _BREAK))  # "\n" separator
+                position += 1
+            for element in paragraph.content_children:
+                length = len(element.text)
+                if isinstance(element, CT_RegularTextRun):
+                    run = element
+                else:
+                    run = _BREAK if element.tag == _BR_TAG else None
+                segments.append((position, position + length, run))
+                position += length
+        starts = [start for start, _, _ in segments]
+
+        edits = {}
+        for start, end, _, replacement in spans:
+            index = bisect_right(starts, start) - 1
+            first = True
+            while index < len(segments) and segments[index][0] < end:
+                segment_start, segment_end, run = segments[index]
+                index += 1
+                if segment_end <= start:
+                    continue
+                if run is _BREAK and not first:
+                    continue
+                if run is None or run is _BREAK:
+                    return False
+                edits.setdefault(run, []).append(
+                    (
+                        max(start, segment_start) - segment_start,
+                        min(end, segment_end) - segment_start,
+                        replacement if first else "",
+                    )
+                )
+                first = False
+
+        for run, run_edits in edits.items():
+            text = run.text
+            parts = []
+            cursor = 0
+            for edit_start, edit_end, replacement in run_edits:
+                parts.append(text[cursor:edit_start])
+                parts.append(replacement)
+                cursor = edit_end
+            parts.append(text[cursor:])
+            run.text = "".join(parts)
+        return True
+
+    def _patch_remaining(
+        self, paragraphs, matcher: ReplacementMatcher, hit: Dict[str, str]
+    ) -> int:
+        """
+        Patch originals left over after the run-level pass into their runs.
+        
+        Every occurrence the run pass missed is considered (split across runs,
+        or differing in case or whitespace), including further occurrences of
+        originals it did replace elsewhere in the frame. Matches overlapping text
+        it inserted are ignored, so a replacement is never replaced again. Unlike
+        the full fallback, the frame is never rewritten: if the leftovers cannot
+        be patched run by run, they are left as is.
+        
+        Args:
+            paragraphs: <a:p> elements of the text frame, after the run-level pass
+            matcher (ReplacementMatcher): Matcher for the slide's replacements
+            hit (Dict[str, str]): Pairs already applied by the run-level pass
+            
+        Returns:
+            int: Number of distinct originals patched
+        """
+        text = "\n".join(paragraph.text for paragraph in paragraphs)
+        inserted = [
+            (start, start + len(replacement))
+            for replacement in set(hit.values())
+            if replacement
+            for start in self._find_all(text, replacement)
+        ]
+        spans = [
+            span
+            for span in matcher.find_normalized(text)
+            if not any(start < span[1] and span[0] < end for start, end in inserted)
+        ]
+        if not spans or not self._patch_runs(paragraphs, spans):
+            return 0
+
+        applied = {original: replacement for _, _, original, replacement in spans}
+        for original, replacement in applied.items():
+            self.logger.debug("  Replaced: '%s' -> '%s'", original, replacement)
+        return len(applied)
+
+    @staticmethod
+    def _find_all(text: str, substring: str):
+        """Yield the start of every occurrence of substring in text."""
+        start = text.find(substring)
+        while start != -1:
+            yield start
+            start = text.find(substring, start + 1)
+
+    def _iter_shape_elements(self, spTree):
+        """
+        Iterate over shape elements, descending into group shapes.
+        
+        Groups are flattened iteratively with a deque rather than by recursion,
+        and their children are yielded in place of the group so document order
+        is preserved. The elements are the ones python-pptx builds its shape
+        proxies from, so no proxy is created here.
+        
+        Args:
+            spTree: The slide's <p:spTree> element
+            
+        Yields:
+            Every non-group shape element, in document order
+        """
+        stack = deque(spTree.iter_shape_elms())
+        while stack:
+            element = stack.popleft()
+            if element.tag == _GROUP_TAG:
+                stack.extendleft(reversed(list(element.iter_shape_elms())))
+                continue
+            yield element
+
+    def _process_shape(self, element, shapes, slide_data: SlideData):
         """
         Process a single shape from the slide and extract relevant data.
         
@@ -117,26 +609,46 @@ class PPTXProcessor:
         and tables. Extracts text content and updates element counts in slide_data.
         
         Args:
-            shape: The python-pptx shape object to process
+            element: The shape's XML element
+            shapes: The slide's python-pptx shape collection, used to build a
+                proxy for shapes that are not autoshapes
             slide_data (SlideData): The slide data object to update with extracted information
         """
         try:
-            # Text content
-            if shape.has_text_frame and shape.text_frame.text.strip():
-                slide_data.text_content.append(shape.text_frame.text.strip())
-
-            # Count different shape types
-            if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                slide_data.images_count += 1
-            elif shape.shape_type == MSO_SHAPE_TYPE.CHART:
-                slide_data.charts_count += 1
-            elif shape.shape_type == MSO_SHAPE_TYPE.TABLE:
-                slide_data.tables_count += 1
-                # Extract table text
-                self._extract_table_text(shape, slide_data)
+            # Autoshapes and text boxes, the most common shapes by far, are the
+            # only ones with a text frame, and their type is never needed
+            if element.tag == _SP_TAG:
+                txBody = element.find(_TXBODY_TAG)
+                if txBody is not None:
+                    text = _body_text(txBody).strip()
+                    if text:
+                        slide_data.text_content.append(text)
+                return
+
+            # Count different shape types, building a proxy only for shapes that
+            # can have one of the counted types
+            if element.tag not in _COUNTED_TAGS:
+                return
+            shape = shapes._shape_factory(element)
+            handler = self._shape_handlers.get(shape.shape_type)
+            if handler:
+                handler(shape, slide_data)
 
         except Exception as e:
-            self.logger.warning(f"Error processing shape: {e}")
+            self.logger.warning("Error processing shape: %s", e)
+
+    def _count_picture(self, shape, slide_data: SlideData):
+        """Count a picture shape."""
+        slide_data.images_count += 1
+
+    def _count_chart(self, shape, slide_data: SlideData):
+        """Count a chart shape."""
+        slide_data.charts_count += 1
+
+    def _process_table(self, shape, slide_data: SlideData):
+        """Count a table shape and extract its cell text."""
+        slide_data.tables_count += 1
+        self._extract_table_text(shape, slide_data)
 
     def _extract_table_text(self, table_shape, slide_data: SlideData):
         """
@@ -150,16 +662,20 @@ class PPTXProcessor:
             slide_data (SlideData): The slide data object to update with table text
         """
         try:
-            table = table_shape.table
-            for row in table.rows:
-                for cell in row.cells:
-                    if cell.text_frame and cell.text_frame.text.strip():
-                        slide_data.text_content.append(cell.text_frame.text.strip())
+            append = slide_data.text_content.append
+            for txBody in _CELL_BODIES_XPATH(table_shape._element):
+                text = _body_text(txBody).strip()
+                if text:
+                    append(text)
         except Exception as e:
-            self.logger.warning(f"Error extracting table text: {e}")
+            self.logger.warning("Error extracting table text: %s", e)
 
     def apply_replacements_to_file(
-        self, input_file: str, output_file: str, all_detections: Dict[int, List]
+        self,
+        input_file: str,
+        output_file: str,
+        all_detections: Dict[int, List],
+        presentation=None,
     ) -> Dict[str, Any]:
         """
         Apply text replacements to PowerPoint file and save sanitized version.
@@ -172,6 +688,52 @@ class PPTXProcessor:
             output_file (str): Path where the sanitized file will be saved
             all_detections (Dict[int, List]): Dictionary mapping slide numbers to 
                 lists of Detection objects containing replacement information
+            presentation (optional): input_file already loaded with
+                load_presentation (e.g. the one given to parse_presentation).
+                When given, the file is not loaded again. It is modified in
+                place, so it cannot be reused for another output afterwards
+                
+        Returns:
+            Dict[str, Any]: Result dictionary, see apply_replacements
+        """
+        if presentation is not None:
+            return self.apply_replacements(
+                presentation, all_detections, output_file, source_file=input_file
+            )
+
+        try:
+            presentation = self.load_presentation(input_file)
+        except Exception as e:
+            self.logger.error(f"Error applying replacements: {e}")
+            return self._failed_replacement_result(e)
+
+        return self.apply_replacements(
+            presentation, all_detections, output_file, source_file=input_file
+        )
+
+    def apply_replacements(
+        self,
+        presentation,
+        all_detections: Dict[int, List],
+        output_file: str = None,
+        source_file: str = None,
+    ) -> Dict[str, Any]:
+        """
+        Apply text replacements to a loaded presentation.
+        
+        Applies all specified text replacements while preserving formatting and,
+        if output_file is given, saves the sanitized presentation there.
+        
+        Args:
+            presentation: The python-pptx Presentation to modify in place
+            all_detections (Dict[int, List]): Dictionary mapping slide numbers to 
+                lists of Detection objects containing replacement information
+            output_file (str, optional): Path where the sanitized file will be saved
+            source_file (str, optional): File the presentation was loaded from.
+                Only the presentation matters: when it comes from
+                load_presentation, the output is written by copying the loaded
+                bytes and replacing only the edited slide parts (see
+                _save_patched); otherwise it is saved in full
                 
         Returns:
             Dict[str, Any]: Result dictionary containing:
@@ -181,34 +743,61 @@ class PPTXProcessor:
                 - error (str, optional): Error message if operation failed
         """
         try:
-            # Load presentation
-            presentation = Presentation(input_file)
-            self.logger.info(f"Loaded presentation for replacement: {input_file}")
-
-            # Process each slide
+            # Only slides with detections are visited; every other slide is
+            # counted as untouched up front, without building its proxy
+            slides = presentation.slides
+            slide_count = len(slides)
             total_replacements = 0
-            replacements_by_slide = {}
+            replacements_by_slide = dict.fromkeys(range(1, slide_count + 1), 0)
+            edited_parts = []
 
-            for slide_idx, slide in enumerate(presentation.slides):
-                slide_number = slide_idx + 1
-
-                if slide_number in all_detections:
-                    detections = all_detections[slide_number]
-                    replacements_made = self._apply_replacements_to_slide(
-                        slide, detections
-                    )
-                    total_replacements += replacements_made
-                    replacements_by_slide[slide_number] = replacements_made
-                    self.logger.info(
-                        f"Slide {slide_number}: {replacements_made} replacements applied"
-                    )
-                else:
-                    replacements_by_slide[slide_number] = 0
-                    self.logger.info(f"Slide {slide_number}: No detections to apply")
+            # Slides are processed sequentially on purpose: the work is lxml
+            # element access through python-pptx, which holds the GIL, so a thread
+            # pool adds overhead without parallelism. Slides share one in-memory
+            # package, so they cannot be shipped to worker processes either;
+            # sending each slide's XML out and parsing the results back in would
+            # cost more than the ~3 ms per slide the replacements take.
+            for slide_number in sorted(all_detections):
+                if not 1 <= slide_number <= slide_count:
+                    continue
+                # The sanitizer lists every slide, most with no detections
+                if not all_detections[slide_number]:
+                    continue
+                slide = slides[slide_number - 1]
+                edited_parts.append(slide.part)
+                replacements_made = self._apply_replacements_to_slide(
+                    slide, all_detections[slide_number]
+                )
+                total_replacements += replacements_made
+                replacements_by_slide[slide_number] = replacements_made
+                self.logger.info(
+                    "Slide %d: %d replacements applied",
+                    slide_number,
+                    replacements_made,
+                )
+            self.logger.info(
+                "%d slides had no detections to apply",
+                slide_count - len(edited_parts),
+            )
 
             # Save sanitized presentation
-            presentation.save(output_file)
-            self.logger.info(f"Saved sanitized presentation to {output_file}")
+            if output_file:
+                # The file is assembled in memory and written with a single write,
+                # which also makes it safe for the output to overwrite the source
+                # Patching needs the bytes and slide member names recorded by
+                # load_presentation; rereading source_file could not tell which
+                # member each (renamed) slide part came from
+                source = self._source_bytes.get(presentation.part)
+                patched = (
+                    self._patched_members(edited_parts) if source is not None else None
+                )
+                buffer = io.BytesIO()
+                if patched is not None:
+                    self._save_patched(io.BytesIO(source), buffer, patched)
+                else:
+                    presentation.save(buffer)
+                _write_file(output_file, buffer.getbuffer())
+                self.logger.info(f"Saved sanitized presentation to {output_file}")
             self.logger.info(f"Total replacements applied: {total_replacements}")
 
             return {
@@ -219,19 +808,72 @@ class PPTXProcessor:
 
         except Exception as e:
             self.logger.error(f"Error applying replacements: {e}")
-            return {
-                "success": False,
-                "total_replacements": 0,
-                "replacements_by_slide": {},
-                "error": str(e),
-            }
+            return self._failed_replacement_result(e)
+
+    def _patched_members(self, edited_parts: List) -> Optional[Dict[str, bytes]]:
+        """
+        Map edited slide parts to the zip members they were loaded from.
+        
+        A slide part's current partname is not reliable: Presentation.slides
+        renames slide parts after their position in the deck, while the source
+        file's relationships still point at the original member names. Only the
+        names recorded by load_presentation are used.
+        
+        Args:
+            edited_parts (List): Slide parts that replacements were applied to
+            
+        Returns:
+            Optional[Dict[str, bytes]]: New XML per source member name, or None if
+                the member of any part is unknown (the presentation was not loaded
+                by load_presentation)
+        """
+        patched = {}
+        for part in edited_parts:
+            member = self._source_members.get(part)
+            if member is None:
+                return None
+            patched[member] = part.blob
+        return patched
+
+    def _save_patched(self, source, target, patched: Dict[str, bytes]):
+        """
+        Save a sanitized copy by patching the source file's zip.
+        
+        Text replacement only ever edits slide XML, so every other part (media,
+        layouts, masters, ...) is copied over from the source as is, keeping its
+        compression settings. Only the edited slide parts are re-serialized,
+        instead of every part as in Presentation.save().
+        
+        Args:
+            source: Path or file object of the .pptx the presentation was loaded from
+            target: Path or file object the sanitized .pptx is written to
+            patched (Dict[str, bytes]): New XML of the edited slides, keyed on
+                their member name in source (see _patched_members)
+        """
+        with zipfile.ZipFile(source) as source_zip, zipfile.ZipFile(
+            target, "w"
+        ) as target_zip:
+            for item in source_zip.infolist():
+                blob = patched.get(item.filename)
+                target_zip.writestr(
+                    item, blob if blob is not None else source_zip.read(item)
+                )
+
+    def _failed_replacement_result(self, error: Exception) -> Dict[str, Any]:
+        """Build the result dictionary of a failed replacement run."""
+        return {
+            "success": False,
+            "total_replacements": 0,
+            "replacements_by_slide": {},
+            "error": str(error),
+        }
 
     def _apply_replacements_to_slide(self, slide, detections: List[Detection]) -> int:
         """
         Apply replacements to a single slide.
         
         Processes all detection objects for the slide, extracts replacement pairs,
-        and applies them to all shapes on the slide. Replacements are sorted by
+        and applies them to every text frame on the slide. Replacements are sorted by
         length (longest first) to avoid partial replacement issues.
         
         Args:
@@ -245,84 +887,45 @@ class PPTXProcessor:
         if not detections:
             return 0
 
-        # Create sorted replacement list (longest first to avoid partial replacements)
-        replacements = []
-        for detection in detections:
-            if hasattr(detection, "original") and hasattr(detection, "replacement"):
-                replacements.append((detection.original, detection.replacement))
-            elif hasattr(detection, "text") and hasattr(detection, "replacement"):
-                replacements.append((detection.text, detection.replacement))
-
-        if not replacements:
-            return 0
-
-        # Sort by length (longest first)
-        sorted_replacements = sorted(
-            replacements, key=lambda x: len(x[0]), reverse=True
-        )
-
-        self.logger.info(f"Applying {len(sorted_replacements)} replacements:")
-        for original, replacement in sorted_replacements:
-            self.logger.info(f"  '{original}' -> '{replacement}'")
-
-        # Apply replacements to all shapes
-        total_replacements = 0
-        for shape in slide.shapes:
-            replacements_made = self._apply_replacements_to_shape(
-                shape, sorted_replacements
+        # Pull (original, replacement) pairs with one getter per detection class,
+        # chosen once per process (Detection objects carry "original", older
+        # ones "text")
+        first = detections[0]
+        get_pair = _PAIR_GETTERS.get(type(first))
+        if get_pair is None:
+            if not hasattr(first, "replacement"):
+                return 0
+            get_pair = _PAIR_GETTERS.setdefault(
+                type(first),
+                attrgetter(
+                    "original" if hasattr(first, "original") else "text", "replacement"
+                ),
             )
-            total_replacements += replacements_made
+        # Built straight into the hashable tuple the matcher cache is keyed on
+        replacements = tuple(map(get_pair, detections))
 
-        return total_replacements
-    
-    
-    def _apply_replacements_to_shape(
-        self, shape, sorted_replacements: List[Tuple[str, str]]
-    ) -> int:
-        """
-        Apply replacements to a single shape.
-        
-        Handles different shape types (text frames, tables, charts) and applies
-        the specified text replacements while preserving formatting.
-        
-        Args:
-            shape: The python-pptx shape object to modify
-            sorted_replacements (List[Tuple[str, str]]): List of (original, replacement)
-                tuples sorted by length (longest first)
-                
-        Returns:
-            int: Number of replacements made in this shape
-        """
-        try:
-            replacements_made = 0
+        # Sorted by length (longest first) once per distinct set of replacements
+        matcher = build_replacement_matcher(replacements, Config.MATCH_WHOLE_WORDS)
 
-            # Handle text frames
-            if shape.has_text_frame:
-                replacements_made += self._apply_replacements_to_text_frame(
-                    shape.text_frame, sorted_replacements
-                )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Applying %d replacements:", len(matcher.replacements))
+            for original, replacement in matcher.replacements:
+                self.logger.info("  '%s' -> '%s'", original, replacement)
 
-            # Handle tables
-            elif shape.shape_type == MSO_SHAPE_TYPE.TABLE:
-                replacements_made += self._apply_replacements_to_table(
-                    shape.table, sorted_replacements
+        # Apply replacements to every text frame, including table cells and groups
+        total_replacements = 0
+        for text_frame in self._text_frames_of(slide):
+            try:
+                total_replacements += self._apply_replacements_to_text_frame(
+                    text_frame, matcher
                 )
+            except Exception as e:
+                self.logger.warning("Error applying replacements to text frame: %s", e)
 
-            # Handle charts (text in chart elements)
-            elif shape.shape_type == MSO_SHAPE_TYPE.CHART:
-                if hasattr(shape, "text_frame") and shape.text_frame:
-                    replacements_made += self._apply_replacements_to_text_frame(
-                        shape.text_frame, sorted_replacements
-                    )
-
-            return replacements_made
-
-        except Exception as e:
-            self.logger.warning(f"Error applying replacements to shape: {e}")
-            return 0
+        return total_replacements
 
     def _apply_replacements_to_text_frame(
-        self, text_frame, sorted_replacements: List[Tuple[str, str]]
+        self, text_frame, matcher: ReplacementMatcher
     ) -> int:
         """
         Apply replacements to a text frame while preserving formatting.
@@ -337,176 +940,115 @@ class PPTXProcessor:
         
         Args:
             text_frame: The python-pptx text frame object to modify
-            sorted_replacements (List[Tuple[str, str]]): List of (original, replacement)
-                tuples sorted by length (longest first)
+            matcher (ReplacementMatcher): Prebuilt matcher for the slide's
+                (original, replacement) pairs
                 
         Returns:
             int: Number of replacements made in this text frame
         """
-        if not text_frame or not text_frame.paragraphs:
+        if not text_frame:
             return 0
 
+        # Most text frames contain none of the detections; reject them cheaply.
+        # The text is read from the XML, since building it through paragraph and
+        # run proxies would cost more than the matcher's prefilter itself
+        txBody = text_frame._txBody
+        full_text = _body_text(txBody)
+        if not matcher.may_match(full_text):
+            return 0
+
+        # Paragraphs are handled as <a:p> elements, listed once for the frame
+        paragraphs = txBody.findall(_P_TAG)
+
         replacements_made = 0
+        hit = {}
 
-        # Try run-by-run replacement first to preserve formatting
-        for paragraph in text_frame.paragraphs:
-            for run in paragraph.runs:
-                if not run.text:
-                    continue
-                
-                original_text = run.text
-                new_text = original_text
-                
-                # Apply replacements
-                for original, replacement in sorted_replacements:
-                    if original and original in new_text:
-                        new_text = new_text.replace(original, replacement)
-                        self.logger.info(f"  Replaced: '{original}' -> '{replacement}'")
-                
-                # Update text while preserving formatting
-                if new_text != original_text:
-                    # Store original formatting properties
-                    original_font_size = run.font.size
-                    original_font_name = run.font.name
-                    original_bold = run.font.bold
-                    original_italic = run.font.italic
-                    # Safe color handling
-                    original_color = None
-                    try:
-                        if run.font.color and hasattr(run.font.color, 'rgb') and run.font.color.rgb:
-                            original_color = run.font.color.rgb
-                    except:
-                        original_color = None
-                    
-                    # Update the text
-                    run.text = new_text
-                    
-                    # Restore original formatting
-                    if original_font_size:
-                        run.font.size = original_font_size
-                    if original_font_name:
-                        run.font.name = original_font_name
-                    if original_bold is not None:
-                        run.font.bold = original_bold
-                    if original_italic is not None:
-                        run.font.italic = original_italic
-                    if original_color:
-                        try:
-                            run.font.color.rgb = original_color
-                        except:
-                            pass  # Skip color restoration if it fails
-                    
-                    replacements_made += 1
+        # Try run-by-run replacement first to preserve formatting. Runs are
+        # edited through their <a:t> elements: only the text changes and the run
+        # properties (font, size, color, ...) are never touched, so there is
+        # nothing to save and restore, and no _Run/Font proxies are built. Each
+        # run's text is scanned once for all originals, and runs without a match
+        # are left as they are
+        for t in _RUN_TEXTS_XPATH(txBody):
+            original_text = t.text
+            if not original_text:
+                continue
 
-        # If no run-level replacements worked, fall back to full text replacement
-        if not replacements_made:
-            # Get full text content
-            full_text = text_frame.text
-            if not full_text:
-                return 0
+            # Apply replacements
+            new_text, applied = matcher.apply(original_text)
+            # Per-match logs are DEBUG: the slide's pairs are listed at INFO
+            # once, and this loop runs for every matching run of the deck
+            for original, replacement in applied:
+                self.logger.debug("  Replaced: '%s' -> '%s'", original, replacement)
+                hit[original] = replacement
 
-            self.logger.debug(f"Processing text frame: '{full_text}'")
+            if new_text != original_text:
+                # Set through the run, which escapes control characters
+                t.getparent().text = new_text
+                replacements_made += 1
 
-            # Apply replacements to full text
-            new_full_text = full_text
-            applied_replacements = []
+        # Occurrences the run pass missed may span several runs or differ in
+        # case, even for originals it replaced elsewhere; patch those in place
+        if replacements_made:
+            replacements_made += self._patch_remaining(paragraphs, matcher, hit)
+
+        # If no run-level replacements worked, fall back to full text replacement
+        if not replacements_made:
+            # No run was rewritten, so full_text still reflects the frame
+            self.logger.debug("Processing text frame: '%s'", full_text)
 
-            for original, replacement in sorted_replacements:
-                if original and original in new_full_text:
-                    new_full_text = new_full_text.replace(original, replacement)
-                    applied_replacements.append((original, replacement))
-                    self.logger.info(f"  Replaced: '{original}' -> '{replacement}'")
+            # Find replacements in full text; exact and fuzzy (whitespace, case
+            # and typography tolerant) matches are found in one normalized sweep
+            spans = matcher.find_normalized(full_text)
+            applied_replacements = list(
+                {original: replacement for _, _, original, replacement in spans}.items()
+            )
+            for original, replacement in applied_replacements:
+                self.logger.debug("  Replaced: '%s' -> '%s'", original, replacement)
 
-            # If no exact matches, try fuzzy matching
-            if not applied_replacements:
-                fuzzy_results = self.text_processor.apply_fuzzy_replacements(
-                    full_text, sorted_replacements
+            # Matches spanning several runs, even across lines, are patched into
+            # those runs, which keeps every run's formatting and leaves the rest of
+            # the XML alone; only a match through a field rewrites the frame
+            if spans and self._patch_runs(paragraphs, spans):
+                replacements_made = len(applied_replacements)
+                self.logger.info(
+                    "  Patched runs in place: %d replacements", replacements_made
                 )
-                new_full_text = fuzzy_results["new_text"]
-                applied_replacements = fuzzy_results["replacements"]
+                return replacements_made
+
+            new_full_text = ReplacementMatcher.splice(full_text, spans)
 
-            # Update text frame if changes were made
+            # Otherwise rewrite the whole text frame if changes were made
             if applied_replacements and new_full_text != full_text:
                 try:
-                    # Store formatting from first run before clearing
-                    original_font_props = {}
-                    if text_frame.paragraphs and text_frame.paragraphs[0].runs:
-                        first_run = text_frame.paragraphs[0].runs[0]
-                        # Safe color handling
-                        original_color = None
-                        try:
-                            if first_run.font.color and hasattr(first_run.font.color, 'rgb') and first_run.font.color.rgb:
-                                original_color = first_run.font.color.rgb
-                        except:
-                            original_color = None
-                            
-                        original_font_props = {
-                            'size': first_run.font.size,
-                            'name': first_run.font.name,
-                            'bold': first_run.font.bold,
-                            'italic': first_run.font.italic,
-                            'color': original_color
-                        }
-
-                    # Clear and rewrite the entire text frame
+                    # Snapshot the first run's properties (<a:rPr>) before
+                    # clearing: one element copy keeps every font setting,
+                    # theme colors included, without reading them one by one
+                    first_paragraph = paragraphs[0]
+                    first_runs = first_paragraph.r_lst
+                    rPr = first_runs[0].rPr if first_runs else None
+
+                    # Clear and rewrite the entire text frame (clear() keeps the
+                    # first paragraph's element)
                     text_frame.clear()
                     p = text_frame.paragraphs[0]
                     p.text = new_full_text
 
                     # Restore formatting if we captured it
-                    if original_font_props and p.runs:
-                        run = p.runs[0]
-                        if original_font_props.get('size'):
-                            run.font.size = original_font_props['size']
-                        if original_font_props.get('name'):
-                            run.font.name = original_font_props['name']
-                        if original_font_props.get('bold') is not None:
-                            run.font.bold = original_font_props['bold']
-                        if original_font_props.get('italic') is not None:
-                            run.font.italic = original_font_props['italic']
-                        if original_font_props.get('color'):
-                            try:
-                                run.font.color.rgb = original_font_props['color']
-                            except:
-                                pass  # Skip color restoration if it fails
+                    if rPr is not None:
+                        for run in first_paragraph.r_lst:
+                            run._remove_rPr()
+                            run._insert_rPr(copy.deepcopy(rPr))
 
                     replacements_made = len(applied_replacements)
                     self.logger.info(
-                        f"  Updated text frame: {replacements_made} replacements"
+                        "  Updated text frame: %d replacements", replacements_made
                     )
-                    self.logger.debug(f"    Original: '{full_text}'")
-                    self.logger.debug(f"    New: '{new_full_text}'")
+                    self.logger.debug("    Original: '%s'", full_text)
+                    self.logger.debug("    New: '%s'", new_full_text)
 
                 except Exception as e:
-                    self.logger.error(f"Error updating text frame: {e}")
+                    self.logger.error("Error updating text frame: %s", e)
                     return 0
 
         return replacements_made
-
-    def _apply_replacements_to_table(
-        self, table, sorted_replacements: List[Tuple[str, str]]
-    ) -> int:
-        """
-        Apply replacements to table cells.
-        
-        Iterates through all table rows and cells, applying text replacements
-        to each cell's text frame while preserving table structure and formatting.
-        
-        Args:
-            table: The python-pptx table object to modify
-            sorted_replacements (List[Tuple[str, str]]): List of (original, replacement)
-                tuples sorted by length (longest first)
-                
-        Returns:
-            int: Total number of replacements made in all table cells
-        """
-        replacements_made = 0
-
-        for row in table.rows:
-            for cell in row.cells:
-                if cell.text_frame:
-                    replacements_made += self._apply_replacements_to_text_frame(
-                        cell.text_frame, sorted_replacements
-                    )
-
-        return replacements_made
@@ -0,0 +1,140 @@
+"""
+Response Cache
+==============
+
+Content-addressed cache of slide analysis results, shared across runs.
+
+Unlike the checkpoint store, which is tied to one input file, entries are keyed
+on what is actually sent to the model (slide image bytes, slide text, model and
+prompts), so re-running on an unchanged deck, or on a deck sharing slides with
+an earlier one, reuses the stored responses instead of calling the API again.
+Each entry is a small JSON file at `<cache_dir>/<key[:2]>/<key>.json`; entries
+read or written during the run are also kept in memory. With a TTL, entries
+older than it on disk are treated as misses and overwritten by the next put.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import TypeAdapter
+
+from ..models.detection import DetectionResponse
+from ..utils.hashing import update_with_parts
+
+# Encodes and decodes entries as JSON bytes
+_ENTRY = TypeAdapter(DetectionResponse)
+
+
+class ResponseCache:
+    """
+    Two-level (memory, then disk) cache of DetectionResponse results.
+
+    Attributes:
+        cache_dir: Directory holding the cache entries
+        ttl: Maximum age in seconds of a usable entry (None when entries never expire)
+        logger: Logger for tracking cache operations
+    """
+
+    def __init__(self, cache_dir: str, ttl: Optional[float] = None):
+        """
+        Initialize the cache over a directory, created on first write.
+
+        Args:
+            cache_dir (str): Root directory for cache entries
+            ttl (Optional[float]): Maximum age in seconds of a usable entry
+                (None = entries never expire)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self._memory: Dict[str, DetectionResponse] = {}
+
+    @staticmethod
+    def make_key(
+        image_path: Optional[str], slide_text: List[str], *context: str
+    ) -> str:
+        """
+        Compute the cache key of one slide analysis.
+
+        Args:
+            image_path (Optional[str]): Slide image sent to the model, or None
+                for a text-only request
+            slide_text (List[str]): Slide text sent to the model
+            *context (str): Everything else the response depends on, such as the
+                model name and prompt templates
+
+        Returns:
+            str: Hex SHA-256 digest identifying the request
+        """
+        digest = hashlib.sha256()
+        if image_path is None:
+            digest.update(bytes(32))
+        else:
+            # Hashed in chunks: full-resolution renders can be several MB
+            with open(image_path, "rb") as f:
+                digest.update(hashlib.file_digest(f, "sha256").digest())
+        digest.update(json.dumps(list(slide_text), ensure_ascii=False).encode("utf-8"))
+        update_with_parts(digest, context)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Path of the file storing the entry for key."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[DetectionResponse]:
+        """
+        Look up a stored response.
+
+        Args:
+            key (str): Key from make_key
+
+        Returns:
+            Optional[DetectionResponse]: Stored response, or None on a miss
+        """
+        response = self._memory.get(key)
+        if response is not None:
+            return response
+
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                if self.ttl is not None and time.time() - os.fstat(f.fileno()).st_mtime > self.ttl:
+                    return None
+                response = _ENTRY.validate_json(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            # ValueError covers pydantic's ValidationError for a corrupt entry
+            self.logger.warning("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+
+        self._memory[key] = response
+        return response
+
+    def put(self, key: str, response: DetectionResponse):
+        """
+        Store a response in memory and on disk.
+
+        The entry is written to a temporary file and renamed into place, so a
+        crash never leaves a truncated entry behind.
+
+        Args:
+            key (str): Key from make_key
+            response (DetectionResponse): Response to store
+        """
+        self._memory[key] = response
+
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(_ENTRY.dump_json(response))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning("Could not write cache entry %s: %s", path, e)
@@ -18,17 +18,22 @@ Supports detecting:
 - Custom sensitive patterns
 """
 
+import asyncio
 import os
-import json
 import logging
-from typing import List, Dict, Any
+from collections import Counter
+from typing import List, Dict
 from pathlib import Path
 
+import orjson
+
 from .pptx_processor import PPTXProcessor
-from .openai_analyzer import OpenAIAnalyzer
+from .openai_analyzer import OpenAIAnalyzer, is_trivial_slide
+from .checkpoint import CheckpointStore
 from ..models.slide_data import SlideData
-from ..models.detection import Detection
+from ..models.detection import Detection, DetectionResponse
 from ..models.sanitization_report import SanitizationReport
+from config import Config
 
 
 class PowerPointSanitizer:
@@ -45,7 +50,10 @@ class PowerPointSanitizer:
         openai_api_key: str,
         images_dir: str = "data/pngs",
         prompts_dir: str = "config/prompts",
-        model: str = "gpt-4.1-mini-2025-04-14"
+        model: str = "gpt-4.1-mini-2025-04-14",
+        batch_mode: bool = False,
+        checkpoint_dir: str = None,
+        force_refresh: bool = False
     ):
         """
         Initialize the sanitizer.
@@ -55,12 +63,21 @@ class PowerPointSanitizer:
             images_dir: Folder with slide images (default: "data/pngs")
             prompts_dir: Folder with AI prompts (default: "config/prompts")
             model: OpenAI model to use (default: "gpt-4.1-mini-2025-04-14")
+            batch_mode: Analyze slides through the OpenAI Batch API instead of
+                real-time requests (cheaper, but can take up to 24h)
+            checkpoint_dir: Folder for per-slide analysis checkpoints. When set,
+                an interrupted run resumes without re-analyzing finished slides
+            force_refresh: Re-analyze slides even if the response cache or a
+                checkpoint holds a result for them
         """
         self.pptx_processor = PPTXProcessor()
         self.analyzer = OpenAIAnalyzer(api_key=openai_api_key, 
                                     prompts_dir=prompts_dir,
-                                    model=model)
+                                    model=model,
+                                    force_refresh=force_refresh)
         self.images_dir = Path(images_dir)
+        self.batch_mode = batch_mode
+        self.checkpoint_dir = checkpoint_dir
         self.logger = logging.getLogger(__name__)
 
 
@@ -77,47 +94,175 @@ class PowerPointSanitizer:
         Returns:
             SanitizationReport: Summary of what was found and changed
         """
-        # Set default output file name
-        if not output_file:
-            input_path = Path(input_file)
-            output_file = str(
-                input_path.parent / f"{input_path.stem}_sanitized{input_path.suffix}"
-            )
+        output_file = output_file or self._default_output_file(input_file)
+        presentation, slides_data, checkpoint = self._extract(input_file)
 
-        self.logger.info(f"Starting sanitization of {input_file}")
+        # 2. AI-Enhanced Sensitive Data Detection
+        try:
+            if self._use_batch(slides_data):
+                all_detections = self._analyze_slides_batch(slides_data, checkpoint)
+            else:
+                all_detections = self._analyze_slides_realtime(slides_data, checkpoint)
+        finally:
+            if checkpoint:
+                checkpoint.flush()
 
-        # 1. Shape Identification & Extraction
-        slides_data = self.pptx_processor.parse_presentation(input_file)
-        self.logger.info(f"Extracted data from {len(slides_data)} slides")
+        return self._finish(
+            input_file, output_file, presentation, slides_data, all_detections, checkpoint
+        )
+
+    async def sanitize_presentation_async(
+        self, input_file: str, output_file: str = None
+    ) -> SanitizationReport:
+        """
+        Sanitize a PowerPoint file from a running event loop.
+        
+        Coroutine form of sanitize_presentation, for callers that already run an
+        event loop (where the asyncio.run behind real-time analysis is not
+        available). Slides are analyzed on the caller's loop; parsing, batch
+        polling and replacement are blocking work and run in a worker thread.
+        
+        Args:
+            input_file: Path to the PowerPoint file to sanitize
+            output_file: Where to save the clean file (optional)
+        
+        Returns:
+            SanitizationReport: Summary of what was found and changed
+        """
+        output_file = output_file or self._default_output_file(input_file)
+        presentation, slides_data, checkpoint = await asyncio.to_thread(
+            self._extract, input_file
+        )
 
         # 2. AI-Enhanced Sensitive Data Detection
-        all_detections = {}
-        for slide in slides_data:
-            slide_image_path = self.images_dir / f"slide_{slide.slide_number:02d}.png"
-
-            if slide_image_path.exists():
-                detections = self._analyze_slide(slide, slide_image_path)
-                all_detections[slide.slide_number] = detections
-                detection_count = (
-                    len(detections.detections)
-                    if hasattr(detections, "detections")
-                    else len(detections)
-                )
-                self.logger.info(
-                    f"Slide {slide.slide_number}: {detection_count} detections"
+        try:
+            if self._use_batch(slides_data):
+                all_detections = await asyncio.to_thread(
+                    self._analyze_slides_batch, slides_data, checkpoint
                 )
             else:
-                self.logger.warning(
-                    f"Image not found for slide {slide.slide_number}: {slide_image_path}"
+                all_detections = await self._analyze_slides_realtime_async(
+                    slides_data, checkpoint
                 )
-                all_detections[slide.slide_number] = []
+        finally:
+            if checkpoint:
+                checkpoint.flush()
+
+        return await asyncio.to_thread(
+            self._finish,
+            input_file,
+            output_file,
+            presentation,
+            slides_data,
+            all_detections,
+            checkpoint,
+        )
 
-        # 3. Content Replacement
-        processed_detections = self._convert_detections_for_replacement(all_detections)
+    def _use_batch(self, slides_data: List[SlideData]) -> bool:
+        """
+        Decide whether the deck is analyzed through the Batch API.
+        
+        Args:
+            slides_data: Parsed slides of the presentation
+                
+        Returns:
+            True in batch mode, or when the deck has at least
+            Config.BATCH_MIN_SLIDES slides
+        """
+        if self.batch_mode:
+            return True
+        if Config.BATCH_MIN_SLIDES and len(slides_data) >= Config.BATCH_MIN_SLIDES:
+            self.logger.info(
+                "%d slides (>= %d), analyzing with the Batch API",
+                len(slides_data),
+                Config.BATCH_MIN_SLIDES,
+            )
+            return True
+        return False
 
-        # Apply all replacements to file
-        replacement_result = self.pptx_processor.apply_replacements_to_file(
-            input_file, output_file, processed_detections
+    @staticmethod
+    def _default_output_file(input_file: str) -> str:
+        """
+        Name the sanitized file after the input file.
+        
+        Args:
+            input_file: Path to the PowerPoint file to sanitize
+        
+        Returns:
+            Path of the input with a "_sanitized" suffix on its stem
+        """
+        input_path = Path(input_file)
+        return str(input_path.parent / f"{input_path.stem}_sanitized{input_path.suffix}")
+
+    def _extract(self, input_file: str):
+        """
+        Load and parse the presentation, and open its checkpoint store.
+        
+        Args:
+            input_file: Path to the PowerPoint file to sanitize
+        
+        Returns:
+            Tuple of the loaded presentation, its parsed slides and the
+            CheckpointStore (None when checkpointing is off)
+        """
+        self.logger.info(f"Starting sanitization of {input_file}")
+
+        # Fail on a bad API key or model name before spending time on parsing
+        self.analyzer.verify_access()
+
+        # 1. Shape Identification & Extraction
+        # The presentation is loaded once and reused for the replacement step
+        presentation = self.pptx_processor.load_presentation(input_file)
+        slides_data = self.pptx_processor.parse_presentation(input_file, presentation)
+        self.logger.info(f"Extracted data from {len(slides_data)} slides")
+
+        checkpoint = (
+            CheckpointStore(
+                self.checkpoint_dir,
+                input_file,
+                settings=self.analyzer.analysis_settings,
+            )
+            if self.checkpoint_dir
+            else None
+        )
+        if checkpoint and self.analyzer.force_refresh:
+            # Re-analyze every slide: drop stored results and any pending batch
+            checkpoint.clear()
+        if checkpoint:
+            self.logger.info("Using checkpoints in %s", checkpoint.run_dir)
+        return presentation, slides_data, checkpoint
+
+    def _finish(
+        self,
+        input_file: str,
+        output_file: str,
+        presentation,
+        slides_data: List[SlideData],
+        all_detections: Dict[int, List[Detection]],
+        checkpoint: CheckpointStore = None,
+    ) -> SanitizationReport:
+        """
+        Apply the detections, save the sanitized file and write the report.
+        
+        Once the sanitized file is saved, the run's checkpoints have served
+        their purpose and are deleted, so a later run analyzes the deck afresh.
+        They are kept while any slide that needed analysis has no result.
+        
+        Args:
+            input_file: Path to the PowerPoint file being sanitized
+            output_file: Where to save the clean file
+            presentation: The presentation loaded by _extract
+            slides_data: Parsed slides of the presentation
+            all_detections: Detections per slide number
+            checkpoint: Optional store of this run's results
+        
+        Returns:
+            SanitizationReport: Summary of what was found and changed
+        """
+        # 3. Content Replacement
+        # Apply all replacements and save the sanitized file
+        replacement_result = self.pptx_processor.apply_replacements(
+            presentation, all_detections, output_file, source_file=input_file
         )
 
         # Handle both old (bool) and new (dict) return types
@@ -136,6 +281,23 @@ class PowerPointSanitizer:
                     f"Failed to apply replacements: {replacement_result.get('error', 'Unknown error')}"
                 )
 
+        if checkpoint and replacement_success:
+            unanalyzed = [
+                slide.slide_number
+                for slide in slides_data
+                if self._needs_analysis(slide)
+                and checkpoint.load(slide.slide_number) is None
+            ]
+            if unanalyzed:
+                # Keep what was finished so a rerun only retries these slides
+                self.logger.warning(
+                    "No analysis results for slides %s; their text was left "
+                    "as is. Run again to retry them.",
+                    unanalyzed,
+                )
+            else:
+                checkpoint.clear()
+
         self.logger.info(
             f"Replacement process completed. Total replacements: {total_replacements}"
         )
@@ -149,90 +311,294 @@ class PowerPointSanitizer:
         self.logger.info(f"Sanitization completed. Output: {output_file}")
         return report
 
-    def _analyze_slide(self, slide_data: SlideData, image_path: Path):
+    @staticmethod
+    def _needs_analysis(slide: SlideData) -> bool:
         """
-        Analyze one slide for sensitive content using AI.
+        Check whether a slide is sent for analysis rather than skipped.
         
         Args:
-            slide_data: Text and metadata from the slide
-            image_path: Path to the slide image file
+            slide: Parsed slide
                 
         Returns:
-            List of detected sensitive information or empty list
+            True if the slide has text that is not only boilerplate
         """
-        self.logger.info(f"Analyzing slide {slide_data.slide_number}")
-        self.logger.debug(f"  Text content: {slide_data.text_content}")
-        self.logger.debug(f"  Image path: {image_path}")
-        self.logger.debug(f"  Image exists: {image_path.exists()}")
+        if not slide.text_content:
+            return False
+        return not (Config.SKIP_TRIVIAL_SLIDES and is_trivial_slide(slide.text_content))
 
-        if not slide_data.text_content:
-            self.logger.warning(
-                f"Slide {slide_data.slide_number}: No text content to analyze"
-            )
-            return []
+    def _slide_image_path(self, slide_data: SlideData) -> Path:
+        """
+        Get the path of the rendered image for a slide.
+        
+        Args:
+            slide_data: Slide to look up
+                
+        Returns:
+            Path to the slide's PNG in the images folder
+        """
+        return self.images_dir / f"slide_{slide_data.slide_number:02d}.png"
 
+    def _image_or_none(self, image_path: Path, available_images: set):
+        """
+        Resolve a slide's image for analysis, warning when it is missing.
+        
+        Slides without an image are still analyzed on their text alone, rather
+        than left unsanitized.
+        
+        Args:
+            image_path: Expected path of the slide image
+            available_images: File names from _available_images
+            
+        Returns:
+            The image path as a string, or None if the file does not exist
+        """
+        if image_path.name in available_images:
+            return str(image_path)
+        self.logger.warning(
+            "Image not found: %s, analyzing the slide text only", image_path
+        )
+        return None
+
+    def _available_images(self) -> set:
+        """
+        List the files in the images folder with a single directory scan.
+        
+        Checking membership in this set replaces one stat call per slide.
+        
+        Returns:
+            Set of file names in the images folder (empty if it does not exist)
+        """
         try:
-            detections = self.analyzer.analyze_slide(
-                slide_text=slide_data.text_content, image_path=str(image_path)
-            )
+            with os.scandir(self.images_dir) as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
 
-            detection_count = (
-                len(detections.detections)
-                if hasattr(detections, "detections")
-                else len(detections)
-            )
+    def _analyze_slides_realtime(
+        self, slides_data: List[SlideData], checkpoint: CheckpointStore = None
+    ) -> Dict[int, List[Detection]]:
+        """
+        Analyze slides with concurrent real-time requests.
+        
+        All slides that need analysis are sent at once, with the analyzer
+        bounding how many requests are in flight.
+        
+        Args:
+            slides_data: Text and metadata from all slides
+            checkpoint: Optional store of results from a previous run; slides
+                found there are not analyzed again
+                
+        Returns:
+            Dictionary mapping slide numbers to Detection lists (empty when a
+            slide was skipped or its analysis failed)
+        """
+        all_detections, items, on_result = self._pending_analysis(
+            slides_data, checkpoint
+        )
+        self.analyzer.analyze_slides(items, on_result=on_result)
+        return all_detections
+
+    async def _analyze_slides_realtime_async(
+        self, slides_data: List[SlideData], checkpoint: CheckpointStore = None
+    ) -> Dict[int, List[Detection]]:
+        """
+        Analyze slides with concurrent real-time requests on the running loop.
+        
+        Args:
+            slides_data: Text and metadata from all slides
+            checkpoint: Optional store of results from a previous run
+        
+        Returns:
+            Dictionary mapping slide numbers to Detection lists
+        """
+        all_detections, items, on_result = self._pending_analysis(
+            slides_data, checkpoint
+        )
+        if items:
+            await self.analyzer.analyze_slides_async(items, on_result=on_result)
+        return all_detections
+
+    def _pending_analysis(
+        self, slides_data: List[SlideData], checkpoint: CheckpointStore = None
+    ):
+        """
+        Sort slides into checkpointed, skipped and still to be analyzed.
+        
+        Args:
+            slides_data: Text and metadata from all slides
+            checkpoint: Optional store of results from a previous run
+        
+        Returns:
+            Tuple of the detections known so far per slide number, the
+            (text, image) items to analyze, and the analyzer's on_result
+            callback that records each finished item
+        """
+        all_detections = {}
+        pending = []
+        available_images = self._available_images()
+        for slide in slides_data:
+            slide_image_path = self._slide_image_path(slide)
+            cached = checkpoint.load(slide.slide_number) if checkpoint else None
+
+            all_detections[slide.slide_number] = []
+            if cached is not None:
+                all_detections[slide.slide_number] = self._to_detections(cached)
+                self.logger.info(
+                    "Slide %d: %d detections (from checkpoint)",
+                    slide.slide_number,
+                    len(cached.detections),
+                )
+            elif not slide.text_content:
+                self.logger.warning(
+                    "Slide %d: No text content to analyze", slide.slide_number
+                )
+            elif Config.SKIP_TRIVIAL_SLIDES and is_trivial_slide(slide.text_content):
+                self.logger.info(
+                    "Slide %d: Boilerplate text only, skipping analysis",
+                    slide.slide_number,
+                )
+            else:
+                self.logger.debug(
+                    "Slide %d text content: %s", slide.slide_number, slide.text_content
+                )
+                pending.append(
+                    (slide, self._image_or_none(slide_image_path, available_images))
+                )
+
+        def on_result(index: int, detections) -> None:
+            # Checkpoint each slide as soon as it completes, so an interrupted
+            # run keeps everything finished so far
+            slide_number = pending[index][0].slide_number
+            all_detections[slide_number] = self._to_detections(detections)
+            if checkpoint:
+                checkpoint.save(slide_number, detections)
             self.logger.info(
-                f"Slide {slide_data.slide_number}: Analysis returned {detection_count} detections"
+                "Slide %d: %d detections", slide_number, len(detections.detections)
             )
 
-            return detections
-        except Exception as e:
-            self.logger.error(f"Error analyzing slide {slide_data.slide_number}: {e}")
-            return []
+        # The analyzer takes plain (text, image) pairs and reports back by
+        # index, so no separate columnar copy of the slides is needed
+        items = [(slide.text_content, image_path) for slide, image_path in pending]
+        return all_detections, items, on_result
 
-    def _convert_detections_for_replacement(
-        self, all_detections: Dict[int, Any]
+    def _analyze_slides_batch(
+        self, slides_data: List[SlideData], checkpoint: CheckpointStore = None
     ) -> Dict[int, List[Detection]]:
         """
-        Convert AI detection results to format needed for text replacement.
+        Analyze all slides with a single OpenAI Batch API job.
+        
+        With a checkpoint, the job's ID is stored until its results are in, so
+        rerunning after an interruption waits for the same job again. A job
+        that cannot be collected fails the run rather than leaving its slides
+        unsanitized.
         
         Args:
-            all_detections: Dictionary of detections from AI analysis
+            slides_data: Text and metadata from all slides
+            checkpoint: Optional store of results from a previous run; slides
+                found there are not resubmitted
                 
         Returns:
-            Dictionary of standardized Detection objects for replacement
+            Dictionary mapping slide numbers to Detection lists (empty when a
+            slide was skipped or its request failed)
+        
+        Raises:
+            RuntimeError: If the batch job failed, expired or was cancelled
         """
-        processed_detections = {}
-
-        for slide_number, detections in all_detections.items():
-            if hasattr(detections, "detections"):
-                detection_list = detections.detections
+        all_detections = {slide.slide_number: [] for slide in slides_data}
+        items = []
+        available_images = self._available_images()
+        for slide in slides_data:
+            slide_image_path = self._slide_image_path(slide)
+            cached = checkpoint.load(slide.slide_number) if checkpoint else None
+            if cached is not None:
+                all_detections[slide.slide_number] = self._to_detections(cached)
+            elif not slide.text_content:
+                self.logger.warning(
+                    "Slide %d: No text content to analyze", slide.slide_number
+                )
+            elif Config.SKIP_TRIVIAL_SLIDES and is_trivial_slide(slide.text_content):
+                self.logger.info(
+                    "Slide %d: Boilerplate text only, skipping analysis",
+                    slide.slide_number,
+                )
             else:
-                detection_list = detections if isinstance(detections, list) else []
-
-            # Convert to Detection format
-            pptx_detections = []
-            for detection in detection_list:
-                pptx_detection = Detection(
-                    original=getattr(
-                        detection, "original", getattr(detection, "text", "")
-                    ),
-                    replacement=getattr(detection, "replacement", ""),
-                    category=getattr(detection, "category", "unknown"),
-                    reason=getattr(detection, "reason", ""),
+                items.append(
+                    (
+                        slide.slide_number,
+                        slide.text_content,
+                        self._image_or_none(slide_image_path, available_images),
+                    )
                 )
-                pptx_detections.append(pptx_detection)
 
-            processed_detections[slide_number] = pptx_detections
+        if not items:
+            return all_detections
 
-        return processed_detections
+        batch_id = checkpoint.load_batch_id() if checkpoint else None
+        try:
+            if batch_id:
+                self.logger.info(f"Resuming batch {batch_id} from a previous run")
+            else:
+                batch_id = self.analyzer.submit_batch(items)
+                if checkpoint:
+                    checkpoint.save_batch_id(batch_id)
+            results = self.analyzer.fetch_batch(batch_id)
+        except RuntimeError as e:
+            # The job failed, expired or was cancelled: the next run submits anew
+            if checkpoint:
+                checkpoint.clear_batch_id()
+            self.logger.error(f"Batch analysis failed: {e}")
+            raise
+        except Exception as e:
+            # Any other error (network, interrupted wait) leaves the job running;
+            # its stored ID lets the next run collect it instead of resubmitting
+            self.logger.error(f"Batch analysis failed: {e}")
+            raise
+
+        for slide_number, detections in results.items():
+            all_detections[slide_number] = self._to_detections(detections)
+            if checkpoint:
+                checkpoint.save(slide_number, detections)
+            self.logger.info(
+                "Slide %d: %d detections", slide_number, len(detections.detections)
+            )
+        if checkpoint:
+            # Journal the results before forgetting the job that produced them
+            checkpoint.flush()
+            checkpoint.clear_batch_id()
+
+        return all_detections
+
+    @staticmethod
+    def _to_detections(response: DetectionResponse) -> List[Detection]:
+        """
+        Convert one slide's AI analysis result to the format used downstream.
+        
+        Results are normalized as they are collected, so replacement and
+        reporting use the Detection fields directly without another pass.
+        
+        Args:
+            response: Parsed analysis result of a slide
+                
+        Returns:
+            List of standardized Detection objects
+        """
+        return [
+            Detection(
+                original=detection.original,
+                replacement=detection.replacement,
+                category=detection.category,
+                reason=detection.reason,
+                sensitivity_level=detection.sensitivity_level,
+            )
+            for detection in response.detections
+        ]
 
     def _generate_report(
         self,
         input_file: str,
         output_file: str,
         slides_data: List[SlideData],
-        all_detections: Dict[int, Any],
+        detections_by_slide: Dict[int, List[Detection]],
         total_replacements: int = 0,
     ) -> SanitizationReport:
         """
@@ -242,40 +608,26 @@ class PowerPointSanitizer:
             input_file: Original PowerPoint file path
             output_file: Sanitized PowerPoint file path
             slides_data: Data from all slides
-            all_detections: All sensitive content found
+            detections_by_slide: Normalized detections of every slide
             total_replacements: Number of text replacements made
                 
         Returns:
             SanitizationReport: Summary with statistics and details
         """
-
-        # Count total detections and categorize
-        total_detections = 0
-        categories_summary = {}
-        detections_by_slide = {}
-
-        for slide_number, detections in all_detections.items():
-            if hasattr(detections, "detections"):
-                detection_list = detections.detections
-            else:
-                detection_list = detections if isinstance(detections, list) else []
-
-            detections_by_slide[slide_number] = detection_list
-            total_detections += len(detection_list)
-
-            # Count categories
-            for detection in detection_list:
-                category = getattr(detection, "category", "unknown")
-                categories_summary[category] = categories_summary.get(category, 0) + 1
+        categories_summary = Counter(
+            detection.category
+            for detections in detections_by_slide.values()
+            for detection in detections
+        )
 
         return SanitizationReport(
             original_file=input_file,
             sanitized_file=output_file,
             total_slides=len(slides_data),
-            total_detections=total_detections,
+            total_detections=sum(categories_summary.values()),
             total_replacements=total_replacements,
             detections_by_slide=detections_by_slide,
-            categories_summary=categories_summary,
+            categories_summary=dict(categories_summary),
         )
 
     def _save_report(self, report: SanitizationReport, output_file: str):
@@ -294,25 +646,19 @@ class PowerPointSanitizer:
             "sanitized_file": report.sanitized_file,
             "total_slides": report.total_slides,
             "total_detections": report.total_detections,
-            "total_replacements": getattr(report, "total_replacements", 0),
+            "total_replacements": report.total_replacements,
             "categories_summary": report.categories_summary,
-            "detections_by_slide": {
-                str(slide_num): [
-                    {
-                        "original": getattr(d, "original", getattr(d, "text", "")),
-                        "replacement": getattr(d, "replacement", ""),
-                        "category": getattr(d, "category", "unknown"),
-                        "reason": getattr(d, "reason", ""),
-                        "sensitivity_level": getattr(d, "sensitivity_level", "MEDIUM"),
-                    }
-                    for d in detections
-                ]
-                for slide_num, detections in report.detections_by_slide.items()
-            },
+            # orjson serializes the Detection dataclasses natively, field by field
+            "detections_by_slide": report.detections_by_slide,
         }
 
-        with open(report_file, "w", encoding="utf-8") as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        # orjson emits UTF-8 bytes directly, so write in binary mode; it also
+        # stringifies the integer slide numbers itself (OPT_NON_STR_KEYS)
+        report_file.write_bytes(
+            orjson.dumps(
+                report_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        )
 
         self.logger.info(f"Saved sanitization report to {report_file}")
 
@@ -328,7 +674,7 @@ class PowerPointSanitizer:
         print(f"Sanitized file: {report.sanitized_file}")
         print(f"Total slides: {report.total_slides}")
         print(f"Total detections: {report.total_detections}")
-        print(f"Total replacements: {getattr(report, 'total_replacements', 'N/A')}")
+        print(f"Total replacements: {report.total_replacements}")
 
         print(f"\nDetections by category:")
         for category, count in report.categories_summary.items():
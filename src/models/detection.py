@@ -1,11 +1,12 @@
 """Detection model."""
 
+import sys
 from dataclasses import dataclass
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class Detection:
     """Detection object for compatibility."""
 
@@ -13,11 +14,19 @@ class Detection:
     replacement: str
     category: str = ""
     reason: str = ""
+    sensitivity_level: str = "MEDIUM"
+
+    def __post_init__(self):
+        # The same names and figures recur across slides; share one string each
+        self.original = sys.intern(self.original)
+        self.replacement = sys.intern(self.replacement)
 
 
 class OpenAIDetection(BaseModel):
     """A single sensitive content detection with enhanced details."""
 
+    model_config = ConfigDict(frozen=True)
+
     original: str
     replacement: str
     category: str
@@ -29,3 +38,16 @@ class DetectionResponse(BaseModel):
     """Response containing multiple detections."""
 
     detections: List[OpenAIDetection]
+
+
+class SlideDetections(BaseModel):
+    """Detections for one slide of a multi-slide request."""
+
+    slide_number: int
+    detections: List[OpenAIDetection]
+
+
+class BatchDetectionResponse(BaseModel):
+    """Response to a request covering several slides, one entry per slide."""
+
+    slides: List[SlideDetections]
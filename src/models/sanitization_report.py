@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from .detection import Detection
 
 
-@dataclass
+@dataclass(slots=True)
 class SanitizationReport:
     """Report of sanitization results."""
 
@@ -4,7 +4,7 @@ from typing import List
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class SlideData:
     """Data from a single slide."""
 
@@ -2,5 +2,7 @@
 
 from .text_processing import TextProcessor
 from .log import setup_logging
+from .rate_limiter import TokenBucket
+from .hashing import update_with_parts
 
-__all__ = ["TextProcessor", "setup_logging"]
+__all__ = ["TextProcessor", "setup_logging", "TokenBucket", "update_with_parts"]
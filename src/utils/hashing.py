@@ -0,0 +1,20 @@
+"""Hashing utilities."""
+
+from typing import Any, Iterable
+
+
+def update_with_parts(digest, parts: Iterable[Any]) -> None:
+    """
+    Feed several values into a hash, each prefixed with its length.
+
+    The length prefix keeps the parts from running into each other, so
+    ("ab", "c") and ("a", "bc") hash differently.
+
+    Args:
+        digest: hashlib hash object to update
+        parts (Iterable[Any]): Values to hash, each converted with str()
+    """
+    for part in parts:
+        encoded = str(part).encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
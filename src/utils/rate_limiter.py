@@ -0,0 +1,83 @@
+"""Rate limiting utilities."""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared by sync and async callers.
+
+    Tokens refill continuously at `rate` per second, up to `capacity`, so short
+    bursts go through immediately while the long-run rate stays capped. Each
+    acquire reserves its tokens up front (the balance may go negative), which
+    queues concurrent callers fairly without holding a lock while waiting.
+    A request can take more than one token, e.g. to budget API tokens per minute.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Initialize the bucket, full.
+
+        Args:
+            rate (float): Tokens added per second (sustained requests per second)
+            capacity (float, optional): Maximum burst size. Defaults to rate
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """Add the tokens accrued since the last update. Caller holds the lock."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def _reserve(self, amount: float = 1) -> float:
+        """
+        Take tokens, returning how long the caller must wait before using them.
+
+        Args:
+            amount (float): Number of tokens to take
+
+        Returns:
+            float: Seconds to wait (0 if the tokens were available)
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self, amount: float = 1):
+        """Block until `amount` tokens are available."""
+        delay = self._reserve(amount)
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self, amount: float = 1):
+        """Wait, without blocking the event loop, until `amount` tokens are available."""
+        delay = self._reserve(amount)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float):
+        """
+        Hold back every caller for at least `seconds`, e.g. after a rate limit error.
+
+        Rather than letting each caller retry on its own schedule and run into the
+        limit again, the balance is lowered so the next acquire waits too.
+
+        Args:
+            seconds (float): Minimum time before the next token is handed out
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.rate)
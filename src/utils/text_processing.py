@@ -1,10 +1,385 @@
 """Text processing utilities."""
 
 import re
+from functools import lru_cache
 from typing import List, Tuple, Dict, Any
 import logging
 
 
+_WS_RE = re.compile(r"\s+")
+_WORD_CHAR_RE = re.compile(r"\w")
+
+# Typographic characters folded to their plain ASCII equivalents
+_NORMALIZE_TRANS = str.maketrans(
+    {
+        "\u00a0": " ",  # Non-breaking space
+        "\u2013": "-",  # En dash
+        "\u2014": "-",  # Em dash
+        "\u201c": '"',  # Left double quote
+        "\u201d": '"',  # Right double quote
+        "\u2018": "'",  # Left single quote
+        "\u2019": "'",  # Right single quote
+    }
+)
+
+
+def _normalize(text: str) -> str:
+    """Collapse whitespace and fold special characters in a single translate pass."""
+    return _WS_RE.sub(" ", text.strip()).translate(_NORMALIZE_TRANS)
+
+
+# Detection originals recur for every text frame, while frame texts are mostly
+# seen once; only originals go through the cache so frames cannot evict them
+_normalize_original = lru_cache(maxsize=8192)(_normalize)
+
+
+def _normalize_with_offsets(text: str) -> Tuple[str, List[int]]:
+    """
+    Normalize text like _normalize, also mapping each output character back.
+
+    Args:
+        text (str): Text to normalize
+
+    Returns:
+        Tuple[str, List[int]]: Normalized text, and for each of its characters the
+            index of the character in text it came from
+    """
+    start = len(text) - len(text.lstrip())
+    end = len(text.rstrip())
+    parts = []
+    offsets = []
+    pos = start
+    for match in _WS_RE.finditer(text, start, end):
+        parts.append(text[pos : match.start()])
+        offsets.extend(range(pos, match.start()))
+        # A whitespace run collapses to one space, mapped to the run's first char
+        parts.append(" ")
+        offsets.append(match.start())
+        pos = match.end()
+    parts.append(text[pos:end])
+    offsets.extend(range(pos, end))
+    return "".join(parts).translate(_NORMALIZE_TRANS), offsets
+
+
+@lru_cache(maxsize=4096)
+def _compiled_flexible(search_term: str) -> re.Pattern:
+    """
+    Compile a case-insensitive pattern matching search_term with flexible whitespace.
+
+    Memoized, since the same detection strings are matched against every text frame.
+    """
+    # Escape special regex characters, then let escaped spaces match any whitespace
+    flexible = re.escape(search_term).replace(r"\ ", r"\s*")
+    return re.compile(flexible, re.IGNORECASE)
+
+
+def _trie_pattern(
+    words, whole_words: bool = False, optional_spaces: bool = False
+) -> str:
+    """
+    Build a regex matching any of words, factored by common prefix.
+
+    A flat alternation makes the regex engine try every word at every position;
+    following a prefix trie instead, each position costs at most one branch per
+    character, as in Aho-Corasick. Optional suffixes are greedy, so the longest
+    word matching at a position wins, like a longest-first flat alternation.
+
+    Args:
+        words: Non-empty strings to match literally
+        whole_words (bool): Reject matches that start or end inside a word
+        optional_spaces (bool): Let each space in a word match one space or none
+
+    Returns:
+        str: Pattern source for re.compile
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def token(char: str) -> str:
+        return " ?" if optional_spaces and char == " " else re.escape(char)
+
+    def guard(char: str, lookaround: str) -> str:
+        return lookaround if whole_words and _WORD_CHAR_RE.match(char) else ""
+
+    def build(node, last_char: str) -> str:
+        # Chains of single-child nodes become one literal, so nesting only grows
+        # at branch points and stays shallow even for long words
+        literal = []
+        while len(node) == 1 and "" not in node:
+            (last_char, node), = node.items()
+            literal.append(last_char)
+        prefix = "".join(map(token, literal))
+
+        branches = [token(char) + build(child, char) for char, child in node.items() if char]
+        end = guard(last_char, r"(?!\w)")
+        if not branches:
+            return prefix + end
+        if "" not in node:
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        elif end:
+            body = "(?:" + "|".join(branches + [end]) + ")"
+        else:
+            body = "(?:" + "|".join(branches) + ")?"
+        return prefix + body
+
+    return "|".join(
+        guard(char, r"(?<!\w)") + token(char) + build(child, char)
+        for char, child in trie.items()
+    )
+
+
+class ReplacementMatcher:
+    """
+    Single-pass matcher for a fixed set of (original, replacement) pairs.
+
+    All originals are compiled into one prefix-trie regex, so each text is
+    scanned once instead of once per detection. At every position the longest
+    original wins and matched text is never rescanned, so a replacement cannot
+    itself be replaced by a later pair. With whole_words, originals that start or
+    end with a word character only match at word boundaries, so "Ann" does not
+    rewrite the start of "Annual".
+    """
+
+    def __init__(
+        self, replacements: Tuple[Tuple[str, str], ...], whole_words: bool = False
+    ):
+        # Longest first, so longer originals win over their own substrings
+        self.replacements = sorted(
+            ((o, r) for o, r in replacements if o),
+            key=lambda pair: len(pair[0]),
+            reverse=True,
+        )
+        self._lookup = {}
+        for original, replacement in self.replacements:
+            self._lookup.setdefault(original, replacement)
+        self._pattern = (
+            re.compile(_trie_pattern(self._lookup, whole_words)) if self._lookup else None
+        )
+        # An exact match starts with the first character of some original, as is
+        self._exact_first_chars = frozenset(o[0] for o in self._lookup)
+
+        # Fuzzy matching happens in normalized space. The normalized originals
+        # are scanned for with one case-insensitive trie (where each space is
+        # optional) and a match is mapped back to its pair by its case-folded,
+        # space-free text; a flat alternation of the originals, each in its own
+        # group and longest first by the non-space characters a match needs at
+        # minimum, resolves the rare match that key does not identify
+        normalized = [_normalize_original(o).lower() for o, _ in self.replacements]
+        fuzzy = sorted(
+            (
+                (len(n.replace(" ", "")), n, pair)
+                for n, pair in zip(normalized, self.replacements)
+                if n
+            ),
+            key=lambda entry: entry[0],
+            reverse=True,
+        )
+        self._fuzzy_pairs = [pair for _, _, pair in fuzzy]
+        self._fuzzy_lookup = {}
+        for _, n, pair in fuzzy:
+            self._fuzzy_lookup.setdefault(n.replace(" ", ""), pair)
+        self._fuzzy_trie = (
+            re.compile(
+                _trie_pattern(
+                    dict.fromkeys(n for _, n, _ in fuzzy), whole_words, optional_spaces=True
+                ),
+                re.IGNORECASE,
+            )
+            if fuzzy
+            else None
+        )
+        self._fuzzy_pattern = (
+            re.compile(
+                "|".join(
+                    "(" + self._fuzzy_source(n, whole_words) + ")" for _, n, _ in fuzzy
+                ),
+                re.IGNORECASE,
+            )
+            if fuzzy
+            else None
+        )
+
+        # The trie scan is an exact gate unless an original is blank or lowercasing
+        # changed its length (e.g. "İ"), which a case-insensitive pattern misses
+        self._fuzzy_gate = self._fuzzy_trie is not None and all(
+            n and len(n) == len(_normalize_original(o))
+            for n, (o, _) in zip(normalized, self.replacements)
+        )
+
+        # Cheap prefilter, valid for exact and fuzzy matches alike: any match needs
+        # the (case-folded, normalized) first character of some original and at
+        # least as many non-space characters as the shortest original
+        self._first_chars = frozenset(n[0] for n in normalized if n)
+        self._min_length = fuzzy[-1][0] if fuzzy else 0
+
+    @staticmethod
+    def _fuzzy_source(normalized: str, whole_words: bool) -> str:
+        """Pattern source matching a normalized original with optional spaces."""
+        source = re.escape(normalized).replace(r"\ ", " ?")
+        if whole_words:
+            if _WORD_CHAR_RE.match(normalized[0]):
+                source = r"(?<!\w)" + source
+            if _WORD_CHAR_RE.match(normalized[-1]):
+                source += r"(?!\w)"
+        return source
+
+    def may_match(self, text: str) -> bool:
+        """
+        Cheaply tell whether text could contain any original, exactly or fuzzily.
+
+        Args:
+            text (str): Text to test
+
+        Returns:
+            bool: False only if no replacement can possibly apply to text
+        """
+        if not text or not self._first_chars or len(text) < self._min_length:
+            return False
+        if self._first_chars.isdisjoint(text.lower().translate(_NORMALIZE_TRANS)):
+            return False
+        # Any exact or fuzzy match is also a match of the fuzzy trie in the
+        # normalized text, found by one C-level scan without building offsets
+        if self._fuzzy_gate:
+            return self._fuzzy_trie.search(_normalize(text)) is not None
+        return True
+
+    def apply(self, text: str) -> Tuple[str, List[Tuple[str, str]]]:
+        """
+        Replace every occurrence of the known originals in text.
+
+        Args:
+            text (str): Text to apply replacements to
+
+        Returns:
+            Tuple[str, List[Tuple[str, str]]]: New text and the distinct
+                (original, replacement) pairs that matched, in match order
+        """
+        if self._pattern is None or not text:
+            return text, []
+        # Most runs share no character with the originals' first characters;
+        # the set test runs in C and is about twice as fast as a failed sub()
+        if self._exact_first_chars.isdisjoint(text):
+            return text, []
+
+        applied = {}
+        lookup = self._lookup
+
+        def substitute(match: re.Match) -> str:
+            original = match.group()
+            replacement = lookup[original]
+            applied[original] = replacement
+            return replacement
+
+        # One pass of the regex engine over text, however many originals there are
+        new_text = self._pattern.sub(substitute, text)
+        return new_text, list(applied.items())
+
+    def find_normalized(self, text: str) -> List[Tuple[int, int, str, str]]:
+        """
+        Find originals in text, tolerating case, whitespace and typography.
+
+        Text and originals are compared after normalization (collapsed
+        whitespace, ASCII dashes and quotes, any case), so exact and fuzzy
+        matches are found in one sweep. Match positions are mapped back to
+        the original text.
+
+        Args:
+            text (str): Text to search
+
+        Returns:
+            List[Tuple[int, int, str, str]]: Non-overlapping (start, end, original,
+                replacement) spans of text, in order
+        """
+        if self._fuzzy_pattern is None or not text:
+            return []
+
+        normalized, offsets = _normalize_with_offsets(text)
+        spans = []
+        for match in self._fuzzy_trie.finditer(normalized):
+            pair = self._fuzzy_lookup.get(match.group().lower().replace(" ", ""))
+            if pair is None:
+                # Case folding changed the text's length (e.g. "İ"); identify
+                # the original by its group in the flat alternation
+                pair = self._fuzzy_pairs[
+                    self._fuzzy_pattern.fullmatch(match.group()).lastindex - 1
+                ]
+            original, replacement = pair
+            spans.append(
+                (
+                    offsets[match.start()],
+                    offsets[match.end() - 1] + 1,
+                    original,
+                    replacement,
+                )
+            )
+        return spans
+
+    @staticmethod
+    def splice(text: str, spans: List[Tuple[int, int, str, str]]) -> str:
+        """
+        Replace the given spans of text.
+
+        Args:
+            text (str): Text the spans were found in
+            spans (List[Tuple[int, int, str, str]]): Spans from find_normalized
+
+        Returns:
+            str: Text with every span replaced by its replacement
+        """
+        parts = []
+        cursor = 0
+        for start, end, _, replacement in spans:
+            parts.append(text[cursor:start])
+            parts.append(replacement)
+            cursor = end
+        parts.append(text[cursor:])
+        return "".join(parts)
+
+    def apply_normalized(self, text: str) -> Tuple[str, List[Tuple[str, str]]]:
+        """
+        Replace originals in text, tolerating case, whitespace and typography.
+
+        Only the matched spans (see find_normalized) are replaced; the rest of
+        the text is kept as is.
+
+        Args:
+            text (str): Text to apply replacements to
+
+        Returns:
+            Tuple[str, List[Tuple[str, str]]]: New text and the distinct
+                (original, replacement) pairs that matched, in match order
+        """
+        spans = self.find_normalized(text)
+        if not spans:
+            return text, []
+        applied = {original: replacement for _, _, original, replacement in spans}
+        return self.splice(text, spans), list(applied.items())
+
+
+@lru_cache(maxsize=256)
+def build_replacement_matcher(
+    replacements: Tuple[Tuple[str, str], ...], whole_words: bool = False
+) -> ReplacementMatcher:
+    """
+    Build (or reuse) a ReplacementMatcher for a set of replacements.
+
+    Slides sharing the same detections share one matcher, so the pairs are
+    sorted and compiled once rather than once per slide.
+
+    Args:
+        replacements (Tuple[Tuple[str, str], ...]): (original, replacement) pairs
+        whole_words (bool): Only match originals at word boundaries
+
+    Returns:
+        ReplacementMatcher: Matcher shared by every caller with the same pairs
+    """
+    return ReplacementMatcher(replacements, whole_words)
+
+
 class TextProcessor:
     """Utility class for text processing and normalization."""
 
@@ -16,68 +391,30 @@ class TextProcessor:
         if not text:
             return ""
 
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text.strip())
-        # Handle special characters
-        text = text.replace("\u00a0", " ")  # Non-breaking space
-        text = text.replace("\u2013", "-")  # En dash
-        text = text.replace("\u2014", "-")  # Em dash
-        text = text.replace("\u201c", '"')  # Left double quote
-        text = text.replace("\u201d", '"')  # Right double quote
-        text = text.replace("\u2018", "'")  # Left single quote
-        text = text.replace("\u2019", "'")  # Right single quote
-
-        return text
+        return _normalize(text)
 
     def is_flexible_match(self, text: str, search_term: str) -> bool:
         """Check if search term matches with flexible whitespace/formatting."""
-        # Create flexible pattern
-        pattern = self.create_flexible_pattern(search_term)
-        return bool(re.search(pattern, text, re.IGNORECASE))
+        return bool(_compiled_flexible(search_term).search(text))
 
     def create_flexible_pattern(self, search_term: str) -> str:
         """Create a flexible regex pattern for matching."""
-        # Escape special regex characters
-        escaped = re.escape(search_term)
-        # Replace escaped spaces with flexible whitespace pattern
-        flexible = escaped.replace(r"\ ", r"\s*")
-        return flexible
+        return _compiled_flexible(search_term).pattern
 
     def apply_fuzzy_replacements(
         self, text: str, sorted_replacements: List[Tuple[str, str]]
     ) -> Dict[str, Any]:
         """Apply fuzzy/flexible text replacements."""
-        new_text = text
-        applied_replacements = []
-
-        self.logger.info(f"Attempting fuzzy matching for: '{text}'")
-
-        for original, replacement in sorted_replacements:
-            if not original:
-                continue
-
-            # Normalize both texts
-            normalized_text = self.normalize_text_for_matching(new_text)
-            normalized_original = self.normalize_text_for_matching(original)
-
-            # Try different matching strategies
-            if normalized_original in normalized_text:
-                # Simple normalized match
-                new_text = new_text.replace(original, replacement)
-                applied_replacements.append((original, replacement))
-                self.logger.info(
-                    f"  Fuzzy match (normalized): '{original}' -> '{replacement}'"
-                )
+        self.logger.info("Attempting fuzzy matching for: '%s'", text)
 
-            elif self.is_flexible_match(normalized_text, normalized_original):
-                # Flexible regex match
-                pattern = self.create_flexible_pattern(normalized_original)
-                new_text = re.sub(
-                    pattern, replacement, new_text, flags=re.IGNORECASE
-                )
-                applied_replacements.append((original, replacement))
-                self.logger.info(
-                    f"  Fuzzy match (flexible): '{original}' -> '{replacement}'"
-                )
+        # "Fuzzy" here means exact matching after normalization, not similarity
+        # scoring: one regex scan in C, with nothing left for an edit-distance
+        # library or a JIT to speed up. All matches are located first and spliced
+        # into the text in one join, instead of rebuilding the string once per
+        # replacement
+        matcher = build_replacement_matcher(tuple(sorted_replacements))
+        new_text, applied_replacements = matcher.apply_normalized(text)
+        for original, replacement in applied_replacements:
+            self.logger.info("  Fuzzy match: '%s' -> '%s'", original, replacement)
 
         return {"new_text": new_text, "replacements": applied_replacements}
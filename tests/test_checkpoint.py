@@ -0,0 +1,85 @@
+"""Tests for persisting per-slide results across runs."""
+
+from src.core.checkpoint import CheckpointStore
+from src.models.detection import DetectionResponse, OpenAIDetection
+
+
+def _response(original):
+    return DetectionResponse(
+        detections=[
+            OpenAIDetection(
+                original=original, replacement="[X]", category="c", reason="r"
+            )
+        ]
+    )
+
+
+def _deck(tmp_path, content=b"deck"):
+    path = tmp_path / "deck.pptx"
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_results_survive_a_restart(tmp_path):
+    deck = _deck(tmp_path)
+    store = CheckpointStore(str(tmp_path / "cache"), deck, flush_every=2)
+    store.save(1, _response("Acme"))
+    store.save(2, _response("Bob"))
+    store.save(3, _response("Carol"))
+
+    # Slide 3 is still buffered, so only the first flushed batch is on disk
+    reopened = CheckpointStore(str(tmp_path / "cache"), deck)
+    assert reopened.load(1) == _response("Acme")
+    assert reopened.load(2) == _response("Bob")
+    assert reopened.load(3) is None
+
+    store.flush()
+    assert CheckpointStore(str(tmp_path / "cache"), deck).load(3) == _response("Carol")
+
+
+def test_truncated_line_is_skipped_and_appends_continue(tmp_path):
+    deck = _deck(tmp_path)
+    store = CheckpointStore(str(tmp_path / "cache"), deck)
+    store.save(1, _response("Acme"))
+    store.flush()
+    with open(store.journal_path, "ab") as f:
+        f.write(b'{"slides": {"2": {"detec')
+
+    reopened = CheckpointStore(str(tmp_path / "cache"), deck)
+    reopened.save(3, _response("Carol"))
+    reopened.flush()
+
+    final = CheckpointStore(str(tmp_path / "cache"), deck)
+    assert final.load(1) == _response("Acme")
+    assert final.load(2) is None
+    assert final.load(3) == _response("Carol")
+
+
+def test_other_contents_or_settings_start_a_fresh_run(tmp_path):
+    deck = _deck(tmp_path)
+    store = CheckpointStore(str(tmp_path / "cache"), deck, settings=("model-a",))
+    store.save(1, _response("Acme"))
+    store.flush()
+
+    other_model = CheckpointStore(str(tmp_path / "cache"), deck, settings=("model-b",))
+    assert other_model.load(1) is None
+
+    _deck(tmp_path, b"edited deck")
+    edited = CheckpointStore(str(tmp_path / "cache"), deck, settings=("model-a",))
+    assert edited.load(1) is None
+
+
+def test_batch_id_round_trip_and_clear(tmp_path):
+    deck = _deck(tmp_path)
+    store = CheckpointStore(str(tmp_path / "cache"), deck)
+    store.save_batch_id("batch-1")
+    store.save(1, _response("Acme"))
+    store.flush()
+
+    assert CheckpointStore(str(tmp_path / "cache"), deck).load_batch_id() == "batch-1"
+
+    store.clear()
+
+    reopened = CheckpointStore(str(tmp_path / "cache"), deck)
+    assert reopened.load_batch_id() is None
+    assert reopened.load(1) is None
@@ -0,0 +1,151 @@
+"""Tests for collecting Batch API results and async client handling."""
+
+import asyncio
+import json
+import logging
+from types import SimpleNamespace
+
+from src.core.openai_analyzer import OpenAIAnalyzer
+from src.models.detection import DetectionResponse
+
+
+def _output_line(slide_number, content, status_code=200):
+    return json.dumps(
+        {
+            "custom_id": f"slide-{slide_number}",
+            "response": {
+                "status_code": status_code,
+                "body": {"choices": [{"message": {"content": content}}]},
+            },
+        }
+    )
+
+
+class _FakeBatchClient:
+    """Stands in for client.batches and client.files of a finished batch."""
+
+    def __init__(self, files):
+        self.files_by_id = files
+        self.batches = self
+        self.files = self
+
+    def retrieve(self, batch_id):
+        return SimpleNamespace(
+            status="completed",
+            output_file_id="output" if "output" in self.files_by_id else None,
+            error_file_id="errors" if "errors" in self.files_by_id else None,
+        )
+
+    def content(self, file_id):
+        return SimpleNamespace(text="\n".join(self.files_by_id[file_id]))
+
+
+def _analyzer(files):
+    analyzer = OpenAIAnalyzer(api_key="test", prompts_dir="config/prompts")
+    analyzer.client = _FakeBatchClient(files)
+    return analyzer
+
+
+def test_fetch_batch_skips_bad_lines_and_keeps_the_rest(caplog):
+    detections = {
+        "detections": [
+            {"original": "Acme", "replacement": "[C]", "category": "c", "reason": "r"}
+        ]
+    }
+    analyzer = _analyzer(
+        {
+            "output": [
+                _output_line(1, json.dumps(detections)),
+                _output_line(2, "{not json"),
+                _output_line(3, None),
+                "garbage",
+                _output_line(4, json.dumps({"detections": []})),
+                _output_line(5, "", status_code=500),
+            ],
+            "errors": [
+                json.dumps({"custom_id": "slide-6", "error": {"message": "expired"}})
+            ],
+        }
+    )
+
+    with caplog.at_level(logging.ERROR):
+        results = analyzer.fetch_batch("batch")
+
+    assert sorted(results) == [1, 4]
+    assert results[1].detections[0].replacement == "[C]"
+    logged = caplog.text
+    assert "slide 2 could not be parsed" in logged
+    assert "slide 3 could not be parsed" in logged
+    assert "slide 5 failed" in logged
+    assert "slide 6 failed" in logged and "expired" in logged
+
+
+def test_fetch_batch_without_output_file():
+    assert _analyzer({}).fetch_batch("batch") == {}
+
+
+class _FakeAsyncClient:
+    """Stands in for AsyncOpenAI; fails requests sent after it is closed."""
+
+    def __init__(self):
+        self.closed = False
+        self.requests = 0
+        self.chat = SimpleNamespace(completions=self)
+
+    async def parse(self, response_format, **kwargs):
+        assert not self.closed, "request sent on a closed client"
+        self.requests += 1
+        await asyncio.sleep(0.01)
+        parsed = response_format.model_validate({"detections": [], "slides": []})
+        message = SimpleNamespace(parsed=parsed)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def close(self):
+        self.closed = True
+
+
+def _async_analyzer(tmp_path):
+    analyzer = OpenAIAnalyzer(
+        api_key="test",
+        prompts_dir="config/prompts",
+        requests_per_second=1000,
+        cache_dir=str(tmp_path / "responses"),
+    )
+    analyzer.clients = []
+
+    def new_client():
+        analyzer.clients.append(_FakeAsyncClient())
+        return analyzer.clients[-1]
+
+    analyzer._new_async_client = new_client
+    return analyzer
+
+
+def test_concurrent_async_calls_use_their_own_clients(tmp_path):
+    analyzer = _async_analyzer(tmp_path)
+    short = [(["Short call slide"], None)]
+    long = [([f"Long call slide {n}"], None) for n in range(4)]
+
+    async def both():
+        return await asyncio.gather(
+            analyzer.analyze_slides_async(short, concurrency=1),
+            analyzer.analyze_slides_async(long, concurrency=1),
+        )
+
+    short_results, long_results = asyncio.run(both())
+
+    assert all(isinstance(r, DetectionResponse) for r in short_results + long_results)
+    assert len(analyzer.clients) == 2
+    assert all(client.closed for client in analyzer.clients)
+
+
+def test_cached_async_call_creates_no_client(tmp_path):
+    analyzer = _async_analyzer(tmp_path)
+    items = [(["Cached slide"], None)]
+    asyncio.run(analyzer.analyze_slides_async(items))
+    analyzer.clients.clear()
+
+    results = asyncio.run(analyzer.analyze_slides_async(items))
+
+    assert isinstance(results[0], DetectionResponse)
+    assert analyzer.clients == []
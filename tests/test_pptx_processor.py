@@ -0,0 +1,152 @@
+"""Tests for saving sanitized decks by patching the source zip."""
+
+from pptx import Presentation
+
+from src.core.pptx_processor import PPTXProcessor
+from src.models.detection import Detection
+
+
+def _reordered_deck(path):
+    """
+    Save a 3-slide deck whose slide order differs from its zip member order.
+
+    Slide i has the title "Title i" and a text box "ACME-i"; the deck shows
+    them in the order 3, 1, 2 while the files stay slide1..3.xml.
+    """
+    presentation = Presentation()
+    for number in (1, 2, 3):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[5])
+        slide.shapes.title.text = f"Title {number}"
+        slide.shapes.add_textbox(0, 0, 100, 100).text_frame.text = f"ACME-{number}"
+    slide_ids = presentation.slides._sldIdLst
+    last = slide_ids[-1]
+    slide_ids.remove(last)
+    slide_ids.insert(0, last)
+    presentation.save(path)
+
+
+def _slide_texts(path):
+    return [
+        [shape.text_frame.text for shape in slide.shapes if shape.has_text_frame]
+        for slide in Presentation(path).slides
+    ]
+
+
+def test_patched_save_keeps_slides_of_a_reordered_deck(tmp_path):
+    source = str(tmp_path / "reordered.pptx")
+    output = str(tmp_path / "sanitized.pptx")
+    _reordered_deck(source)
+    processor = PPTXProcessor()
+    presentation = processor.load_presentation(source)
+    processor.parse_presentation(source, presentation)
+
+    result = processor.apply_replacements(
+        presentation,
+        {1: [Detection(original="ACME-3", replacement="REDACTED")], 2: [], 3: []},
+        output,
+        source_file=source,
+    )
+
+    assert result["success"]
+    assert _slide_texts(output) == [
+        ["Title 3", "REDACTED"],
+        ["Title 1", "ACME-1"],
+        ["Title 2", "ACME-2"],
+    ]
+
+
+def test_patched_save_with_a_single_slide_map(tmp_path):
+    source = str(tmp_path / "reordered.pptx")
+    output = str(tmp_path / "sanitized.pptx")
+    _reordered_deck(source)
+    processor = PPTXProcessor()
+    presentation = processor.load_presentation(source)
+
+    processor.apply_replacements(
+        presentation, {2: [Detection(original="ACME-1", replacement="REDACTED")]}, output
+    )
+
+    assert _slide_texts(output) == [
+        ["Title 3", "ACME-3"],
+        ["Title 1", "REDACTED"],
+        ["Title 2", "ACME-2"],
+    ]
+
+
+def test_presentation_not_from_load_presentation_is_saved_in_full(tmp_path):
+    source = str(tmp_path / "reordered.pptx")
+    output = str(tmp_path / "sanitized.pptx")
+    _reordered_deck(source)
+    presentation = Presentation(source)
+
+    PPTXProcessor().apply_replacements(
+        presentation,
+        {1: [Detection(original="ACME-3", replacement="REDACTED")]},
+        output,
+        source_file=source,
+    )
+
+    assert _slide_texts(output) == [
+        ["Title 3", "REDACTED"],
+        ["Title 1", "ACME-1"],
+        ["Title 2", "ACME-2"],
+    ]
+
+
+def test_patched_save_over_the_source_file(tmp_path):
+    source = str(tmp_path / "reordered.pptx")
+    _reordered_deck(source)
+    processor = PPTXProcessor()
+    presentation = processor.load_presentation(source)
+    processor.parse_presentation(source, presentation)
+
+    result = processor.apply_replacements(
+        presentation,
+        {3: [Detection(original="ACME-2", replacement="REDACTED")]},
+        source,
+        source_file=source,
+    )
+
+    assert result["success"]
+    assert _slide_texts(source) == [
+        ["Title 3", "ACME-3"],
+        ["Title 1", "ACME-1"],
+        ["Title 2", "REDACTED"],
+    ]
+
+
+def test_slides_without_detections_are_not_rewritten(tmp_path):
+    source = str(tmp_path / "reordered.pptx")
+    output = str(tmp_path / "sanitized.pptx")
+    _reordered_deck(source)
+    processor = PPTXProcessor()
+    presentation = processor.load_presentation(source)
+    patched = []
+    save_patched = processor._save_patched
+
+    def spy(source, target, members):
+        patched.extend(members)
+        save_patched(source, target, members)
+
+    processor._save_patched = spy
+    processor.apply_replacements(
+        presentation,
+        {1: [Detection(original="ACME-3", replacement="REDACTED")], 2: [], 3: []},
+        output,
+    )
+
+    assert patched == ["ppt/slides/slide3.xml"]
+
+
+def test_cached_parse_hands_out_independent_slides(tmp_path):
+    source = str(tmp_path / "reordered.pptx")
+    _reordered_deck(source)
+    processor = PPTXProcessor()
+
+    first = processor.parse_presentation(source)
+    first[0].text_content.append("edited")
+    first[0].title = "edited"
+    second = processor.parse_presentation(source)
+
+    assert "edited" not in second[0].text_content
+    assert second[0].title != "edited"
@@ -0,0 +1,55 @@
+"""Tests for the content-addressed response cache."""
+
+import os
+
+from src.core.response_cache import ResponseCache
+from src.models.detection import DetectionResponse, OpenAIDetection
+
+
+def _response(original):
+    return DetectionResponse(
+        detections=[
+            OpenAIDetection(
+                original=original, replacement="[X]", category="c", reason="r"
+            )
+        ]
+    )
+
+
+def test_entries_survive_a_restart(tmp_path):
+    key = ResponseCache.make_key(None, ["Acme"], "model")
+    ResponseCache(str(tmp_path)).put(key, _response("Acme"))
+
+    assert ResponseCache(str(tmp_path)).get(key) == _response("Acme")
+
+
+def test_key_covers_image_text_and_context(tmp_path):
+    image = tmp_path / "slide.png"
+    image.write_bytes(b"image")
+    key = ResponseCache.make_key(str(image), ["Acme"], "model", "prompt")
+
+    assert key == ResponseCache.make_key(str(image), ["Acme"], "model", "prompt")
+    assert key != ResponseCache.make_key(None, ["Acme"], "model", "prompt")
+    assert key != ResponseCache.make_key(str(image), ["Acme Corp"], "model", "prompt")
+    assert key != ResponseCache.make_key(str(image), ["Acme"], "model", "other")
+    # Length prefixes keep the context parts from running into each other
+    assert key != ResponseCache.make_key(str(image), ["Acme"], "modelprompt", "")
+
+    image.write_bytes(b"edited image")
+    assert key != ResponseCache.make_key(str(image), ["Acme"], "model", "prompt")
+
+
+def test_expired_and_corrupt_entries_are_misses(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    expired = ResponseCache.make_key(None, ["old"])
+    corrupt = ResponseCache.make_key(None, ["corrupt"])
+    cache.put(expired, _response("old"))
+    cache.put(corrupt, _response("corrupt"))
+    old = cache._entry_path(expired)
+    os.utime(old, (0, 0))
+    cache._entry_path(corrupt).write_bytes(b'{"detections": [')
+
+    reopened = ResponseCache(str(tmp_path), ttl=60)
+
+    assert reopened.get(expired) is None
+    assert reopened.get(corrupt) is None
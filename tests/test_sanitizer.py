@@ -0,0 +1,99 @@
+"""Tests for batch analysis failures and checkpoint cleanup."""
+
+import pytest
+from pptx import Presentation
+
+from src.core.checkpoint import CheckpointStore
+from src.core.sanitizer import PowerPointSanitizer
+from src.models.detection import DetectionResponse
+
+
+def _deck(path):
+    """Save a 2-slide deck with one text box per slide."""
+    presentation = Presentation()
+    for number in (1, 2):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+        text_frame = slide.shapes.add_textbox(0, 0, 100, 100).text_frame
+        text_frame.text = f"Quarterly results of Acme branch {number}"
+    presentation.save(path)
+
+
+def _sanitizer(tmp_path, submit, fetch):
+    sanitizer = PowerPointSanitizer(
+        openai_api_key="test",
+        images_dir=str(tmp_path / "pngs"),
+        batch_mode=True,
+        checkpoint_dir=str(tmp_path / "cache"),
+    )
+    sanitizer.analyzer.verify_access = lambda: None
+    sanitizer.analyzer.submit_batch = submit
+    sanitizer.analyzer.fetch_batch = fetch
+    return sanitizer
+
+
+def _checkpoint(sanitizer, tmp_path, deck):
+    return CheckpointStore(
+        str(tmp_path / "cache"), deck, settings=sanitizer.analyzer.analysis_settings
+    )
+
+
+def test_batch_error_fails_the_run_and_keeps_the_job(tmp_path):
+    deck = str(tmp_path / "deck.pptx")
+    output = str(tmp_path / "sanitized.pptx")
+    _deck(deck)
+
+    def fetch(batch_id):
+        raise ConnectionError("network down")
+
+    sanitizer = _sanitizer(tmp_path, lambda items: "batch-1", fetch)
+
+    with pytest.raises(ConnectionError):
+        sanitizer.sanitize_presentation(deck, output)
+
+    assert not (tmp_path / "sanitized.pptx").exists()
+    assert _checkpoint(sanitizer, tmp_path, deck).load_batch_id() == "batch-1"
+
+
+def test_failed_batch_job_fails_the_run_and_is_forgotten(tmp_path):
+    deck = str(tmp_path / "deck.pptx")
+    _deck(deck)
+
+    def fetch(batch_id):
+        raise RuntimeError("Batch batch-1 ended with status expired")
+
+    sanitizer = _sanitizer(tmp_path, lambda items: "batch-1", fetch)
+
+    with pytest.raises(RuntimeError):
+        sanitizer.sanitize_presentation(deck, str(tmp_path / "sanitized.pptx"))
+
+    assert _checkpoint(sanitizer, tmp_path, deck).load_batch_id() is None
+
+
+def test_checkpoint_is_kept_while_a_slide_has_no_result(tmp_path):
+    deck = str(tmp_path / "deck.pptx")
+    output = str(tmp_path / "sanitized.pptx")
+    _deck(deck)
+    found = DetectionResponse(detections=[])
+    sanitizer = _sanitizer(
+        tmp_path, lambda items: "batch-1", lambda batch_id: {1: found}
+    )
+
+    sanitizer.sanitize_presentation(deck, output)
+
+    checkpoint = _checkpoint(sanitizer, tmp_path, deck)
+    assert checkpoint.load(1) == found
+    assert checkpoint.load(2) is None
+    assert checkpoint.load_batch_id() is None
+
+    # The rerun only submits the missing slide, then cleans up
+    submitted = []
+
+    def submit(items):
+        submitted.extend(number for number, _, _ in items)
+        return "batch-2"
+
+    sanitizer = _sanitizer(tmp_path, submit, lambda batch_id: {2: found})
+    sanitizer.sanitize_presentation(deck, output)
+
+    assert submitted == [2]
+    assert not checkpoint.run_dir.exists()
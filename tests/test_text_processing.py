@@ -0,0 +1,166 @@
+"""Tests for replacement matching and in-place run patching."""
+
+from pptx import Presentation
+
+from src.core.pptx_processor import PPTXProcessor
+from src.utils.text_processing import (
+    ReplacementMatcher,
+    TextProcessor,
+    build_replacement_matcher,
+)
+
+
+def _text_frame(runs):
+    """Build a one-paragraph text frame from (text, bold) runs."""
+    presentation = Presentation()
+    slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+    text_frame = slide.shapes.add_textbox(0, 0, 100, 100).text_frame
+    paragraph = text_frame.paragraphs[0]
+    for text, bold in runs:
+        run = paragraph.add_run()
+        run.text = text
+        run.font.bold = bold
+    return text_frame
+
+
+def test_longest_original_wins():
+    matcher = ReplacementMatcher((("John", "[P1]"), ("John Smith", "[PERSON]")))
+
+    new_text, applied = matcher.apply("John Smith met John.")
+
+    assert new_text == "[PERSON] met [P1]."
+    assert applied == [("John Smith", "[PERSON]"), ("John", "[P1]")]
+
+
+def test_replacements_are_not_replaced_again():
+    matcher = ReplacementMatcher((("A", "B"), ("B", "C")))
+
+    assert matcher.apply("A B")[0] == "B C"
+
+
+def test_whole_words_skips_matches_inside_words():
+    matcher = ReplacementMatcher((("Ann", "[X]"),), whole_words=True)
+
+    assert matcher.apply("Ann wrote the Annual report")[0] == (
+        "[X] wrote the Annual report"
+    )
+
+
+def test_whole_words_only_guards_word_characters():
+    matcher = ReplacementMatcher((("C++", "[LANG]"), ("$5", "[AMT]")), whole_words=True)
+
+    new_text, _ = matcher.apply("We use C++ and pay $5 each, not $50")
+
+    assert new_text == "We use [LANG] and pay [AMT] each, not $50"
+
+
+def test_exact_match_does_not_cross_nbsp():
+    matcher = ReplacementMatcher((("John Smith", "[PERSON]"),))
+
+    assert matcher.apply("John\u00a0Smith") == ("John\u00a0Smith", [])
+
+
+def test_normalized_match_tolerates_case_whitespace_and_nbsp():
+    matcher = ReplacementMatcher((("Acme Corp", "[CLIENT]"),))
+
+    assert matcher.apply_normalized("Visit ACME  Corp today")[0] == (
+        "Visit [CLIENT] today"
+    )
+    assert matcher.apply_normalized("Visit Acme\u00a0Corp today")[0] == (
+        "Visit [CLIENT] today"
+    )
+    # Spaces in an original are optional in the normalized text
+    assert matcher.apply_normalized("AcmeCorp wins")[0] == "[CLIENT] wins"
+
+
+def test_normalized_match_folds_typography():
+    matcher = ReplacementMatcher((("Smith’s plan – v2", "[PLAN]"),))
+
+    assert matcher.apply_normalized("Smith's plan - v2 rocks")[0] == "[PLAN] rocks"
+
+
+def test_find_normalized_maps_spans_to_original_text():
+    matcher = ReplacementMatcher((("John Smith", "[PERSON]"),))
+    text = "  Call JOHN   Smith now"
+
+    spans = matcher.find_normalized(text)
+
+    assert spans == [(7, 19, "John Smith", "[PERSON]")]
+    assert ReplacementMatcher.splice(text, spans) == "  Call [PERSON] now"
+
+
+def test_may_match_prefilter():
+    matcher = ReplacementMatcher((("Acme Corp", "[CLIENT]"),))
+
+    assert not matcher.may_match("nothing here")
+    assert matcher.may_match("acme corp")
+
+
+def test_fuzzy_replacements_keep_unmatched_text():
+    result = TextProcessor().apply_fuzzy_replacements(
+        "Hello  JOHN   smith!", [("John Smith", "[P]")]
+    )
+
+    assert result == {"new_text": "Hello  [P]!", "replacements": [("John Smith", "[P]")]}
+
+
+def test_matchers_are_shared_per_replacement_set():
+    pairs = (("a", "b"),)
+
+    assert build_replacement_matcher(pairs) is build_replacement_matcher(pairs)
+
+
+def test_patch_across_runs_keeps_run_formatting():
+    text_frame = _text_frame(
+        [("Contact ", False), ("Jo", True), ("hn Sm", False), ("ith", True), (" today", False)]
+    )
+    matcher = ReplacementMatcher((("John Smith", "[PERSON]"),))
+
+    replacements = PPTXProcessor()._apply_replacements_to_text_frame(text_frame, matcher)
+
+    runs = text_frame.paragraphs[0].runs
+    assert replacements == 1
+    assert text_frame.text == "Contact [PERSON] today"
+    # The replacement takes the first matched run's formatting; the runs around
+    # it are untouched
+    assert (runs[0].text, runs[0].font.bold) == ("Contact ", False)
+    assert (runs[1].text, runs[1].font.bold) == ("[PERSON]", True)
+    assert (runs[-1].text, runs[-1].font.bold) == (" today", False)
+
+
+def test_patch_across_paragraphs_keeps_paragraphs():
+    text_frame = _text_frame([("Acme", False)])
+    text_frame.add_paragraph().text = "Corp rules"
+    matcher = ReplacementMatcher((("Acme Corp", "[CLIENT]"),))
+
+    replacements = PPTXProcessor()._apply_replacements_to_text_frame(text_frame, matcher)
+
+    assert replacements == 1
+    assert [paragraph.text for paragraph in text_frame.paragraphs] == [
+        "[CLIENT]",
+        " rules",
+    ]
+
+
+def test_repeat_split_across_runs_is_patched_after_a_run_hit():
+    text_frame = _text_frame([("Acme Corp wins", False)])
+    paragraph = text_frame.add_paragraph()
+    for text in ("Acme", " Corp", " again"):
+        paragraph.add_run().text = text
+    matcher = ReplacementMatcher((("Acme Corp", "[C]"),))
+
+    PPTXProcessor()._apply_replacements_to_text_frame(text_frame, matcher)
+
+    assert [paragraph.text for paragraph in text_frame.paragraphs] == [
+        "[C] wins",
+        "[C] again",
+    ]
+
+
+def test_repeat_in_another_case_is_patched_after_a_run_hit():
+    text_frame = _text_frame([("Acme Corp and ACME CORP", False)])
+    matcher = ReplacementMatcher((("Acme Corp", "[C]"),))
+
+    PPTXProcessor()._apply_replacements_to_text_frame(text_frame, matcher)
+
+    assert text_frame.text == "[C] and [C]"